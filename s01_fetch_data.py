@@ -5,24 +5,32 @@ Fetch valuation measures for the Magnificent 7 from multiple sources:
   - StockAnalysis.com (via Selenium web scraping)
 
 Export:
-  1) valuation_measures_full.csv  (all periods, tidy format)
+  1) valuation_measures_full.parquet  (all periods, tidy format, partitioned by Fetch_Date)
   2) valuation_measures_current.csv  (only "Current" values, wide format)
 """
 
-import time
+import asyncio
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-import yfinance as yf
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 import re
 from typing import List, Dict, Optional
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 import yaml
 
+# yfinance, selenium, aiohttp and bs4 are imported lazily inside the
+# functions that use them: together they add ~0.5s of import time, which a
+# run that hits the daily already-fetched guard (or the disk cache) never
+# needs to pay.
+
+from tool.cache import FileCache
+
+# Per-(source, date, ticker) disk cache so re-runs within a day skip the
+# network even when a partial failure kept the data out of the CSV
+_fetch_cache = FileCache()
+
 
 def load_tickers_from_config() -> List[str]:
     """Load stock tickers from config/01_config_fetch.yaml file."""
@@ -56,30 +64,44 @@ def load_term_conversion_table() -> Dict[str, Dict[str, str]]:
         return {'yahoo_finance': {}, 'stockanalysis': {}}
     
     df = pd.read_csv(conversion_file, skipinitialspace=True)
-    
-    # Create mapping dictionaries
-    yahoo_to_consolidated = {}
-    sa_to_consolidated = {}
-    
-    for _, row in df.iterrows():
-        consolidated = row['consolidated_term'].strip()
-        yahoo_term = row['yahoo_finance'].strip()
-        sa_term = row['stock_analysis'].strip()
-        
-        yahoo_to_consolidated[yahoo_term] = consolidated
-        sa_to_consolidated[sa_term] = consolidated
-    
+
+    # Create mapping dictionaries (vectorized strip + zip instead of iterrows)
+    consolidated = df['consolidated_term'].str.strip()
+    yahoo_to_consolidated = dict(zip(df['yahoo_finance'].str.strip(), consolidated))
+    sa_to_consolidated = dict(zip(df['stock_analysis'].str.strip(), consolidated))
+
     return {
         'yahoo_finance': yahoo_to_consolidated,
         'stockanalysis': sa_to_consolidated
     }
 
 
+def migrate_full_csv_to_parquet(csv_path: str, parquet_path: str) -> None:
+    """
+    One-time migration of the legacy full CSV into the Fetch_Date-partitioned
+    Parquet dataset. No-op once the Parquet dataset exists (the legacy CSV is
+    left in place but no longer written to).
+    """
+    if os.path.isdir(parquet_path) or not os.path.exists(csv_path):
+        return
+
+    legacy_df = pd.read_csv(csv_path)
+    legacy_df.to_parquet(parquet_path, partition_cols=['Fetch_Date'], engine='pyarrow')
+    print(f"✓ Migrated {len(legacy_df)} records from {csv_path} to {parquet_path}")
+
+
 def fetch_yahoo_finance_data(ticker_symbol: str) -> Optional[Dict[str, any]]:
     """
     Fetch valuation measures for a ticker using yfinance API.
     Returns a dictionary of valuation metrics.
     """
+    fetch_date = datetime.now().strftime('%Y-%m-%d')
+    cached = _fetch_cache.get('yahoo_finance', fetch_date, ticker_symbol)
+    if cached is not None:
+        return cached
+
+    import yfinance as yf
+
     try:
         ticker = yf.Ticker(ticker_symbol)
         info = ticker.info
@@ -96,22 +118,240 @@ def fetch_yahoo_finance_data(ticker_symbol: str) -> Optional[Dict[str, any]]:
             "Enterprise Value/Revenue": info.get('enterpriseToRevenue'),
             "Enterprise Value/EBITDA": info.get('enterpriseToEbitda'),
         }
-        
+
+        _fetch_cache.set('yahoo_finance', fetch_date, ticker_symbol, measures)
         return measures
     except Exception as e:
         print(f"  ERROR fetching Yahoo data for {ticker_symbol}: {e}")
         return None
 
 
+# Consolidated measure name -> (module, field) path in Yahoo's quoteSummary payload
+_YAHOO_QUOTESUMMARY_MODULES = 'summaryDetail,defaultKeyStatistics,financialData'
+_YAHOO_QUOTESUMMARY_FIELDS = {
+    "Market Cap": ('summaryDetail', 'marketCap'),
+    "Enterprise Value": ('defaultKeyStatistics', 'enterpriseValue'),
+    "Trailing P/E": ('summaryDetail', 'trailingPE'),
+    "Forward P/E": ('summaryDetail', 'forwardPE'),
+    "PEG Ratio (5yr expected)": ('defaultKeyStatistics', 'pegRatio'),
+    "Price/Sales (ttm)": ('summaryDetail', 'priceToSalesTrailing12Months'),
+    "Price/Book (mrq)": ('defaultKeyStatistics', 'priceToBook'),
+    "Enterprise Value/Revenue": ('defaultKeyStatistics', 'enterpriseToRevenue'),
+    "Enterprise Value/EBITDA": ('defaultKeyStatistics', 'enterpriseToEbitda'),
+}
+
+
+def _loads_json(raw: bytes):
+    """
+    Parse a JSON payload with orjson when available (C parser, ~3x faster on
+    the large quoteSummary responses), falling back to the stdlib parser.
+    """
+    try:
+        import orjson
+        return orjson.loads(raw)
+    except ImportError:
+        import json
+        return json.loads(raw)
+
+
+async def _fetch_yahoo_quotesummary_async(ticker_symbols: List[str]) -> Dict[str, Optional[Dict[str, any]]]:
+    """
+    Fetch quoteSummary for all tickers concurrently on one aiohttp session.
+    All requests share a single event loop and TCP/TLS connection pool, so
+    the wall time is bounded by the slowest ticker instead of the sum.
+    """
+    import aiohttp
+
+    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+    timeout = aiohttp.ClientTimeout(total=15)
+
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=20),
+                                     headers=headers, timeout=timeout) as session:
+        # Yahoo requires a cookie + crumb pair for the quoteSummary API
+        async with session.get('https://fc.yahoo.com') as response:
+            await response.read()
+        async with session.get('https://query2.finance.yahoo.com/v1/test/getcrumb') as response:
+            crumb = await response.text()
+
+        async def fetch_one(ticker: str) -> Optional[Dict[str, any]]:
+            url = f'https://query2.finance.yahoo.com/v10/finance/quoteSummary/{ticker}'
+            params = {'modules': _YAHOO_QUOTESUMMARY_MODULES, 'crumb': crumb}
+            async with session.get(url, params=params) as response:
+                response.raise_for_status()
+                payload = _loads_json(await response.read())
+
+            result = payload.get('quoteSummary', {}).get('result')
+            if not result:
+                return None
+
+            modules = result[0]
+            measures = {}
+            for measure, (module, field) in _YAHOO_QUOTESUMMARY_FIELDS.items():
+                value = modules.get(module, {}).get(field)
+                if isinstance(value, dict):
+                    value = value.get('raw')  # Yahoo wraps numbers as {raw, fmt}
+                measures[measure] = value
+            return measures
+
+        fetched = await asyncio.gather(*[fetch_one(t) for t in ticker_symbols],
+                                       return_exceptions=True)
+
+    return {ticker: (None if isinstance(measures, BaseException) else measures)
+            for ticker, measures in zip(ticker_symbols, fetched)}
+
+
+def fetch_yahoo_finance_batch(ticker_symbols: List[str]) -> Dict[str, Optional[Dict[str, any]]]:
+    """
+    Fetch valuation measures for all tickers with concurrent async calls to
+    Yahoo's quoteSummary endpoint (only the three modules we need, instead
+    of the full payload yf.Ticker(...).info pulls). Tickers the async path
+    misses or leaves incomplete are topped up per ticker via
+    fetch_yahoo_finance_data in a thread pool.
+    """
+    results: Dict[str, Optional[Dict[str, any]]] = {t: None for t in ticker_symbols}
+
+    # Serve cache hits first and only hit the network for the misses
+    fetch_date = datetime.now().strftime('%Y-%m-%d')
+    for ticker in ticker_symbols:
+        results[ticker] = _fetch_cache.get('yahoo_finance', fetch_date, ticker)
+    to_fetch = [t for t in ticker_symbols if results[t] is None]
+    if not to_fetch:
+        return results
+
+    try:
+        results.update(asyncio.run(_fetch_yahoo_quotesummary_async(to_fetch)))
+    except Exception as e:
+        print(f"  WARNING: Async Yahoo quoteSummary fetch failed ({e}), falling back to per-ticker fetch")
+
+    # Top up tickers the batch response missed or left incomplete
+    incomplete = [t for t in to_fetch
+                  if results[t] is None or any(v is None for v in results[t].values())]
+    if incomplete:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = {pool.submit(fetch_yahoo_finance_data, t): t for t in incomplete}
+            for future in as_completed(futures):
+                ticker = futures[future]
+                single = future.result()
+                if single is None:
+                    continue
+                if results[ticker] is None:
+                    results[ticker] = single
+                else:
+                    for measure, value in single.items():
+                        if results[ticker].get(measure) is None:
+                            results[ticker][measure] = value
+
+    for ticker in to_fetch:
+        if results[ticker] is not None:
+            _fetch_cache.set('yahoo_finance', fetch_date, ticker, results[ticker])
+
+    return results
+
+
 def fetch_stockanalysis_data(ticker_symbol: str) -> Optional[Dict[str, any]]:
     """
-    Fetch valuation ratios from StockAnalysis.com using Selenium.
+    Fetch valuation ratios from StockAnalysis.com.
     Fetches: PE Ratio, Forward PE, PS Ratio, PB Ratio, PEG Ratio
+
+    The statistics page is rendered server-side, so a plain requests.get with
+    a browser User-Agent returns the same table Selenium would see - without
+    the cost of launching a headless Chrome (~5-10s and hundreds of MB each).
+    Selenium is kept only as a fallback for when the plain fetch is blocked.
     """
-    driver = None
+    url = f"https://stockanalysis.com/stocks/{ticker_symbol.lower()}/statistics/"
+
+    fetch_date = datetime.now().strftime('%Y-%m-%d')
+    cached = _fetch_cache.get('stockanalysis', fetch_date, ticker_symbol)
+    if cached is not None:
+        return cached
+
+    from bs4 import BeautifulSoup
+
     try:
-        url = f"https://stockanalysis.com/stocks/{ticker_symbol.lower()}/statistics/"
-        
+        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+        response = requests.get(url, headers=headers, timeout=10)
+        response.raise_for_status()
+
+        measures = parse_stockanalysis_page(BeautifulSoup(response.text, 'html.parser').get_text('\n'))
+
+        # If the plain fetch came back but the table is missing (e.g. a block
+        # page), fall back to a real browser render
+        if any(v is not None for v in measures.values()):
+            _fetch_cache.set('stockanalysis', fetch_date, ticker_symbol, measures)
+            return measures
+        print(f"  ⚠ Plain fetch for {ticker_symbol} returned no ratios, falling back to Selenium")
+    except Exception as e:
+        print(f"  ⚠ Plain fetch failed for {ticker_symbol} ({e}), falling back to Selenium")
+
+    measures = fetch_stockanalysis_data_selenium(ticker_symbol)
+    # Only cache real data - an all-N/A fallback result should be retried
+    if measures is not None and any(v is not None for v in measures.values()):
+        _fetch_cache.set('stockanalysis', fetch_date, ticker_symbol, measures)
+    return measures
+
+
+# StockAnalysis format: "PE Ratio 45.49" (label and value on same line).
+# Compiled once at module load; one multiline pass replaces the per-line
+# startswith/split scan.
+_RATIO_RE = re.compile(
+    r'^\s*(PE Ratio|Forward PE|PS Ratio|PB Ratio|PEG Ratio)\s+([-\d.]+)\s*$',
+    re.M
+)
+
+
+def parse_stockanalysis_page(page_text: str) -> Dict[str, any]:
+    """
+    Parse the valuation ratios out of the StockAnalysis statistics page text.
+    Works on both the requests/BeautifulSoup text and the Selenium body text.
+    """
+    # Initialize measures (using names that match StockAnalysis website)
+    measures = {
+        "PE Ratio": None,
+        "Forward PE": None,
+        "PS Ratio": None,
+        "PB Ratio": None,
+        "PEG Ratio": None,
+    }
+
+    for label, value in _RATIO_RE.findall(page_text):
+        try:
+            measures[label] = float(value)
+        except ValueError:
+            continue
+
+    return measures
+
+
+# Shared headless Chrome for the Selenium fallback. Driver + browser startup
+# costs ~2-4s per launch, so one instance is reused across all tickers and
+# only quit at the end of the run. WebDriver is not thread-safe, so the
+# fetch pool serializes access through the lock. The chromedriver service
+# is started once and kept alive separately, so even a browser relaunch
+# after an error skips the service spawn + port handshake.
+_selenium_driver = None
+_selenium_service = None
+_selenium_lock = threading.Lock()
+
+
+def _get_selenium_service():
+    """Return the shared chromedriver service, starting it on first use."""
+    from selenium.webdriver.chrome.service import Service
+
+    global _selenium_service
+    if _selenium_service is None:
+        service = Service()
+        service.start()
+        _selenium_service = service
+    return _selenium_service
+
+
+def _get_selenium_driver():
+    """Return the shared headless Chrome driver, launching it on first use."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    global _selenium_driver
+    if _selenium_driver is None:
         # Setup Chrome options for headless browsing
         chrome_options = Options()
         chrome_options.add_argument('--headless')  # Run in background
@@ -120,73 +360,104 @@ def fetch_stockanalysis_data(ticker_symbol: str) -> Optional[Dict[str, any]]:
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--log-level=3')  # Suppress logs
         chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-        
-        driver = webdriver.Chrome(options=chrome_options)
-        driver.get(url)
-        
-        # Wait for JavaScript to render
-        time.sleep(3)
-        
-        # Initialize measures (using names that match StockAnalysis website)
-        measures = {
-            "PE Ratio": None,
-            "Forward PE": None,
-            "PS Ratio": None,
-            "PB Ratio": None,
-            "PEG Ratio": None,
-        }
-        
-        # Get the page text
-        page_text = driver.find_element(By.TAG_NAME, 'body').text
-        
-        # Parse the valuation ratios section
-        lines = page_text.split('\n')
-        
-        for line in lines:
-            line_stripped = line.strip()
-            
-            try:
-                # StockAnalysis format: "PE Ratio 45.49" (label and value on same line)
-                parts = line_stripped.split()
-                
-                # PE Ratio
-                if line_stripped.startswith('PE Ratio ') and len(parts) == 3:
-                    measures["PE Ratio"] = float(parts[2])
-                
-                # Forward PE
-                elif line_stripped.startswith('Forward PE ') and len(parts) == 3:
-                    measures["Forward PE"] = float(parts[2])
-                
-                # PS Ratio
-                elif line_stripped.startswith('PS Ratio ') and len(parts) == 3:
-                    measures["PS Ratio"] = float(parts[2])
-                
-                # PB Ratio
-                elif line_stripped.startswith('PB Ratio ') and len(parts) == 3:
-                    measures["PB Ratio"] = float(parts[2])
-                
-                # PEG Ratio
-                elif line_stripped.startswith('PEG Ratio ') and len(parts) == 3:
-                    measures["PEG Ratio"] = float(parts[2])
-            
-            except (ValueError, AttributeError, IndexError):
-                continue
-        
-        return measures
-        
-    except Exception as e:
-        print(f"  WARNING: Could not fetch StockAnalysis data for {ticker_symbol}: {e}")
-        # Return structure with N/A values
-        return {
-            "PE Ratio": None,
-            "Forward PE": None,
-            "PS Ratio": None,
-            "PB Ratio": None,
-            "PEG Ratio": None,
-        }
-    finally:
-        if driver:
-            driver.quit()
+
+        # We only read text, so skip images/stylesheets/fonts and return on
+        # DOMContentLoaded instead of waiting for the full load event -
+        # roughly halves page load time on ad-heavy pages
+        chrome_options.page_load_strategy = 'eager'
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.stylesheets': 2,
+            'profile.managed_default_content_settings.fonts': 2,
+        })
+
+        try:
+            # Attach to the long-lived chromedriver service instead of
+            # spawning (and port-scanning for) a fresh one per launch
+            service = _get_selenium_service()
+            _selenium_driver = webdriver.Remote(command_executor=service.service_url,
+                                                options=chrome_options)
+        except Exception:
+            # e.g. chromedriver not on PATH - let Selenium Manager resolve it
+            _selenium_driver = webdriver.Chrome(options=chrome_options)
+    return _selenium_driver
+
+
+def shutdown_selenium_driver() -> None:
+    """Quit the shared fallback driver and its service, if ever launched."""
+    global _selenium_driver, _selenium_service
+    with _selenium_lock:
+        if _selenium_driver is not None:
+            _selenium_driver.quit()
+            _selenium_driver = None
+        if _selenium_service is not None:
+            _selenium_service.stop()
+            _selenium_service = None
+
+
+def fetch_stockanalysis_data_selenium(ticker_symbol: str) -> Optional[Dict[str, any]]:
+    """
+    Fallback: fetch valuation ratios from StockAnalysis.com using Selenium.
+    Only used when the plain requests fetch is blocked or returns no data.
+    """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    global _selenium_driver
+    url = f"https://stockanalysis.com/stocks/{ticker_symbol.lower()}/statistics/"
+
+    with _selenium_lock:
+        try:
+            driver = _get_selenium_driver()
+            driver.get(url)
+
+            # Wait until the valuation table has actually rendered, instead
+            # of a blind 3s sleep (returns as soon as the text appears)
+            WebDriverWait(driver, 10).until(
+                EC.text_to_be_present_in_element((By.TAG_NAME, 'body'), 'PE Ratio')
+            )
+
+            # Get the page text and parse the valuation ratios section
+            page_text = driver.find_element(By.TAG_NAME, 'body').text
+
+            return parse_stockanalysis_page(page_text)
+
+        except Exception as e:
+            print(f"  WARNING: Could not fetch StockAnalysis data for {ticker_symbol}: {e}")
+            # Discard a possibly wedged browser; the next call relaunches it
+            if _selenium_driver is not None:
+                try:
+                    _selenium_driver.quit()
+                except Exception:
+                    pass
+                _selenium_driver = None
+            # Return structure with N/A values
+            return {
+                "PE Ratio": None,
+                "Forward PE": None,
+                "PS Ratio": None,
+                "PB Ratio": None,
+                "PEG Ratio": None,
+            }
+
+
+# Measures that get T/B/M suffix formatting; everything else is a plain ratio.
+# frozenset gives an O(1) membership check without rebuilding a list literal
+# on every row.
+_LARGE_NUM_MEASURES = frozenset({"Market Cap", "Enterprise Value"})
+
+
+def format_ratio(num: Optional[float]) -> str:
+    """Format a plain ratio to two decimals, or N/A when missing."""
+    if num is None or pd.isna(num):
+        return "N/A"
+    return f"{num:.2f}"
+
+
+# Magnitude divisors for format_large_number, largest first
+_SCALES = ((1e12, 'T'), (1e9, 'B'), (1e6, 'M'))
 
 
 def format_large_number(num: Optional[float]) -> str:
@@ -195,17 +466,13 @@ def format_large_number(num: Optional[float]) -> str:
     """
     if num is None or pd.isna(num):
         return "N/A"
-    
+
     try:
         num = float(num)
-        if num >= 1_000_000_000_000:  # Trillions
-            return f"{num / 1_000_000_000_000:.2f}T"
-        elif num >= 1_000_000_000:  # Billions
-            return f"{num / 1_000_000_000:.2f}B"
-        elif num >= 1_000_000:  # Millions
-            return f"{num / 1_000_000:.2f}M"
-        else:
-            return f"{num:.2f}"
+        for divisor, suffix in _SCALES:
+            if num >= divisor:
+                return f"{num / divisor:.2f}{suffix}"
+        return f"{num:.2f}"
     except (ValueError, TypeError):
         return str(num)
 
@@ -218,10 +485,18 @@ def crawl_magnificent7() -> None:
       - Consolidate terms using conversion table
       - Accumulate data in tidy format
       - Save:
-          1) valuation_measures_full.csv (tidy format)
+          1) valuation_measures_full.parquet (tidy format, partitioned by Fetch_Date)
           2) valuation_measures_current.csv (wide format)
     """
-    all_data: List[Dict] = []
+    # Accumulate the tidy rows as parallel column lists - building the
+    # DataFrame from columns skips the per-row dict allocation and dtype
+    # inference a list-of-dicts build pays
+    col_dates: List[str] = []
+    col_sources: List[str] = []
+    col_tickers: List[str] = []
+    col_measures: List[str] = []
+    col_raw: List = []
+    col_formatted: List[str] = []
     failed: List[str] = []
     
     # Get current date for the fetch timestamp
@@ -236,20 +511,23 @@ def crawl_magnificent7() -> None:
     
     # Check which tickers already have data for today
     csv_dir = 'csv'
-    full_csv = os.path.join(csv_dir, "valuation_measures_full.csv")
-    
+    full_parquet = os.path.join(csv_dir, "valuation_measures_full.parquet")
+    migrate_full_csv_to_parquet(os.path.join(csv_dir, "valuation_measures_full.csv"), full_parquet)
+
+    # The dataset is partitioned by Fetch_Date, so today's data - if any -
+    # lives in exactly one directory and nothing else needs to be read
+    today_partition = os.path.join(full_parquet, f"Fetch_Date={fetch_date}")
+
     existing_tickers_today = set()
-    if os.path.exists(full_csv):
-        existing_full_df = pd.read_csv(full_csv)
-        if not existing_full_df.empty:
-            today_data = existing_full_df[existing_full_df['Fetch_Date'] == fetch_date]
-            if not today_data.empty:
-                # Get unique tickers that have data from BOTH sources for today
-                ticker_counts = today_data.groupby('Ticker')['Data_Source'].nunique()
-                existing_tickers_today = set(ticker_counts[ticker_counts == 2].index)
-                
-                if existing_tickers_today:
-                    print(f"\n✓ Found existing data for {fetch_date}: {', '.join(sorted(existing_tickers_today))}")
+    if os.path.isdir(today_partition):
+        today_data = pd.read_parquet(today_partition, columns=['Ticker', 'Data_Source'])
+        if not today_data.empty:
+            # Get unique tickers that have data from BOTH sources for today
+            ticker_counts = today_data.groupby('Ticker')['Data_Source'].nunique()
+            existing_tickers_today = set(ticker_counts[ticker_counts == 2].index)
+
+            if existing_tickers_today:
+                print(f"\n✓ Found existing data for {fetch_date}: {', '.join(sorted(existing_tickers_today))}")
     
     # Filter to only fetch missing tickers
     tickers_to_fetch = [t for t in tickers if t not in existing_tickers_today]
@@ -264,115 +542,141 @@ def crawl_magnificent7() -> None:
     
     tickers = tickers_to_fetch
     
-    # Fetch from both Yahoo Finance and StockAnalysis (missing tickers only)
+    # Fetch from both Yahoo Finance and StockAnalysis concurrently (missing tickers only)
+    # Yahoo runs one concurrent quoteSummary request per ticker over a
+    # shared connection pool;
+    # StockAnalysis is per-page, so a small thread pool bounds concurrency
+    # (each Selenium fallback worker holds a full Chrome instance in RAM).
+    stockanalysis_results: Dict[str, Optional[Dict]] = {}
+
+    print(f"\n{'='*60}")
+    print(f"Fetching {len(tickers)} tickers concurrently...")
+    print(f"{'='*60}")
+
+    try:
+        with ThreadPoolExecutor(max_workers=3) as stockanalysis_pool:
+            stockanalysis_futures = {stockanalysis_pool.submit(fetch_stockanalysis_data, t): t for t in tickers}
+
+            print(f"  Fetching Yahoo Finance data in batch...")
+            yahoo_results = fetch_yahoo_finance_batch(tickers)
+            print(f"  ✓ [Yahoo Finance] batch of {len(tickers)} tickers")
+
+            for future in as_completed(stockanalysis_futures):
+                ticker = stockanalysis_futures[future]
+                try:
+                    stockanalysis_results[ticker] = future.result()
+                    print(f"  ✓ [StockAnalysis] {ticker}")
+                except Exception as e:
+                    print(f"  ERROR fetching StockAnalysis data for {ticker}: {e}")
+                    stockanalysis_results[ticker] = None
+    finally:
+        # The Selenium fallback shares one Chrome instance across tickers;
+        # quit it once the whole fetch phase is done
+        shutdown_selenium_driver()
+
+    # Accumulate results in the original ticker order (after the pools join,
+    # so no lock is needed around the column lists). Bind the per-source
+    # term maps and formatters to locals once instead of re-resolving the
+    # dict-of-dicts lookup and globals on every row.
+    yahoo_map = term_mappings['yahoo_finance']
+    stockanalysis_map = term_mappings['stockanalysis']
+    fmt_large = format_large_number
+    fmt_ratio = format_ratio
+
     for ticker in tickers:
-        print(f"\n{'='*60}")
-        print(f"Processing {ticker}")
-        print(f"{'='*60}")
-        
-        try:
-            # 1. Fetch from Yahoo Finance
-            print(f"  [1/2] Fetching from Yahoo Finance...")
-            yahoo_measures = fetch_yahoo_finance_data(ticker)
-            if yahoo_measures is None:
-                print(f"  !! Could not fetch Yahoo data for {ticker}")
-            else:
-                # Convert to tidy format with consolidated terms
-                for measure_name, value in yahoo_measures.items():
-                    # Use consolidated term if available, otherwise keep original
-                    consolidated_term = term_mappings['yahoo_finance'].get(measure_name, measure_name)
-                    
-                    all_data.append({
-                        "Fetch_Date": fetch_date,
-                        "Data_Source": "yahoo_finance",
-                        "Ticker": ticker,
-                        "Measure": consolidated_term,
-                        "Value_Raw": value,
-                        "Value_Formatted": format_large_number(value) if measure_name in ["Market Cap", "Enterprise Value"] else (f"{value:.2f}" if value is not None and not pd.isna(value) else "N/A")
-                    })
-                print(f"  ✓ Yahoo Finance data fetched")
-            
-            time.sleep(0.5)  # Be polite to Yahoo Finance API
-            
-            # 2. Fetch from StockAnalysis
-            print(f"  [2/2] Fetching from StockAnalysis.com...")
-            stockanalysis_measures = fetch_stockanalysis_data(ticker)
-            if stockanalysis_measures is None:
-                print(f"  !! Could not fetch StockAnalysis data for {ticker}")
-            else:
-                # Convert to tidy format with consolidated terms
-                for measure_name, value in stockanalysis_measures.items():
-                    # Use consolidated term if available, otherwise keep original
-                    consolidated_term = term_mappings['stockanalysis'].get(measure_name, measure_name)
-                    
-                    all_data.append({
-                        "Fetch_Date": fetch_date,
-                        "Data_Source": "stockanalysis",
-                        "Ticker": ticker,
-                        "Measure": consolidated_term,
-                        "Value_Raw": value,
-                        "Value_Formatted": format_large_number(value) if consolidated_term in ["Market Cap", "Enterprise Value"] else (f"{value:.2f}" if value is not None and not pd.isna(value) else "N/A")
-                    })
-                # Check if we got any actual data
-                has_data = any(v is not None and not pd.isna(v) for v in stockanalysis_measures.values())
-                if has_data:
-                    print(f"  ✓ StockAnalysis data fetched successfully")
-                else:
-                    print(f"  ⚠ StockAnalysis data fetched but all values are N/A")
-            
-            time.sleep(1.0)  # Be polite to StockAnalysis
-            
-            print(f"✓ Completed {ticker}")
-            
-        except Exception as e:
-            print(f"  ERROR on {ticker}: {e}")
+        yahoo_measures = yahoo_results.get(ticker)
+        if yahoo_measures is None:
+            print(f"  !! Could not fetch Yahoo data for {ticker}")
+        else:
+            # Convert to tidy format with consolidated terms
+            for measure_name, value in yahoo_measures.items():
+                # Use consolidated term if available, otherwise keep original
+                consolidated_term = yahoo_map.get(measure_name, measure_name)
+
+                col_dates.append(fetch_date)
+                col_sources.append("yahoo_finance")
+                col_tickers.append(ticker)
+                col_measures.append(consolidated_term)
+                col_raw.append(value)
+                col_formatted.append(fmt_large(value) if measure_name in _LARGE_NUM_MEASURES else fmt_ratio(value))
+
+        stockanalysis_measures = stockanalysis_results.get(ticker)
+        if stockanalysis_measures is None:
+            print(f"  !! Could not fetch StockAnalysis data for {ticker}")
+        else:
+            # Convert to tidy format with consolidated terms
+            for measure_name, value in stockanalysis_measures.items():
+                # Use consolidated term if available, otherwise keep original
+                consolidated_term = stockanalysis_map.get(measure_name, measure_name)
+
+                col_dates.append(fetch_date)
+                col_sources.append("stockanalysis")
+                col_tickers.append(ticker)
+                col_measures.append(consolidated_term)
+                col_raw.append(value)
+                col_formatted.append(fmt_large(value) if consolidated_term in _LARGE_NUM_MEASURES else fmt_ratio(value))
+
+        if yahoo_measures is None and stockanalysis_measures is None:
             failed.append(ticker)
 
-    if not all_data:
+    if not col_dates:
         print("No data fetched. Nothing to save.")
         return
 
-    # Create tidy DataFrame for new data
-    new_df = pd.DataFrame(all_data)
+    # Create tidy DataFrame for new data directly from the column lists
+    new_df = pd.DataFrame({
+        "Fetch_Date": col_dates,
+        "Data_Source": col_sources,
+        "Ticker": col_tickers,
+        "Measure": col_measures,
+        "Value_Raw": col_raw,
+        "Value_Formatted": col_formatted,
+    })
 
     # Create csv directory if it doesn't exist
     csv_dir = 'csv'
     os.makedirs(csv_dir, exist_ok=True)
 
-    # Load existing full dataset and append new data
-    full_csv = os.path.join(csv_dir, "valuation_measures_full.csv")
-    if os.path.exists(full_csv):
-        existing_df = pd.read_csv(full_csv)
-        # Append new data to existing
-        full_df = pd.concat([existing_df, new_df], ignore_index=True)
-        print(f"\n[1] Appended new data to existing {full_csv}")
-        print(f"    Total records: {len(existing_df)} → {len(full_df)} (+{len(new_df)} new)")
+    # Build the 'Current' table input in memory: rows an earlier partial run
+    # already appended to today's partition, plus the rows from this run
+    latest_date = fetch_date
+    if os.path.isdir(today_partition):
+        latest_data = pd.concat(
+            [pd.read_parquet(today_partition), new_df.drop(columns=['Fetch_Date'])],
+            ignore_index=True
+        )
     else:
-        full_df = new_df
-        print(f"\n[1] Created new {full_csv}")
-    
-    # Save combined dataset
-    full_df.to_csv(full_csv, index=False)
-    print(f"    Saved full valuation measures to: {full_csv}")
-
-    # Build and save 'Current' consolidated table (wide format) - only latest date
-    # Filter to only the most recent date in the full dataset
-    latest_date = full_df['Fetch_Date'].max()
-    latest_data = full_df[full_df['Fetch_Date'] == latest_date].copy()
-    
-    # Create wide format for current data
-    current_df = latest_data.pivot_table(
-        index=["Ticker", "Data_Source"], 
-        columns="Measure", 
-        values="Value_Formatted",
-        aggfunc='first'  # Take first value if duplicates exist
-    ).reset_index()
-    
+        latest_data = new_df
+
+    # Create wide format for current data. Keys are unique after
+    # drop_duplicates, so a plain unstack reshapes directly without the
+    # groupby-aggregate machinery pivot_table(aggfunc='first') runs.
+    current_df = (
+        latest_data
+        .drop_duplicates(["Ticker", "Data_Source", "Measure"], keep='first')
+        .set_index(["Ticker", "Data_Source", "Measure"])["Value_Formatted"]
+        .unstack("Measure")
+        .reset_index()
+    )
+
     # Add Fetch_Date column at the beginning
     current_df.insert(0, 'Fetch_Date', latest_date)
 
+    # The two outputs are independent now, so encode and write them
+    # concurrently - the C write loops release the GIL, so the full-history
+    # partition append and the current-table CSV overlap
     current_csv = os.path.join(csv_dir, "valuation_measures_current.csv")
-    current_df.to_csv(current_csv, index=False)
+    with ThreadPoolExecutor(max_workers=2) as io_pool:
+        write_futures = [
+            io_pool.submit(new_df.to_parquet, full_parquet,
+                           partition_cols=['Fetch_Date'], engine='pyarrow'),
+            io_pool.submit(current_df.to_csv, current_csv, index=False),
+        ]
+        for future in write_futures:
+            future.result()
+
+    print(f"\n[1] Appended {len(new_df)} new records to {full_parquet}")
+    print(f"    Saved full valuation measures to: {full_parquet}")
     print(f"[2] Saved consolidated 'Current' table to: {current_csv}")
     print(f"    Format: Latest date ({latest_date}) - Each ticker has 2 rows (yahoo_finance + stockanalysis)")
 
@@ -5,17 +5,56 @@ Creates multiple charts to compare valuation metrics across companies.
 """
 
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+import functools
+import logging
 import os
+import re
+import sys
 import yaml
 
-# Set style for better-looking plots
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (14, 10)
-plt.rcParams['font.size'] = 10
+# All status output funnels through one stdout handler; messages pass
+# through verbatim so the output matches the old print() format
+log = logging.getLogger('viz')
+_handler = logging.StreamHandler(sys.stdout)
+_handler.setFormatter(logging.Formatter('%(message)s'))
+log.addHandler(_handler)
+log.setLevel(logging.INFO)
+log.propagate = False
+
+@functools.lru_cache(maxsize=1)
+def _plotting():
+    """Import and configure matplotlib/seaborn on first figure.
+
+    Deferred so importing this module for its data helpers (e.g. from
+    the test scripts) doesn't pay the matplotlib import cost.
+    """
+    import matplotlib
+    matplotlib.use('Agg')  # headless backend: no GUI toolkit, no interactive figure manager
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    import seaborn as sns
+
+    # Set style for better-looking plots
+    sns.set_style("whitegrid")
+    matplotlib.rcParams['figure.figsize'] = (14, 10)
+    matplotlib.rcParams['font.size'] = 10
+    return Figure, FigureCanvasAgg
+
+
+def make_figure(figsize):
+    """Build a Figure directly on the Agg canvas, bypassing pyplot.
+
+    Figures made this way are plain objects: they never enter pyplot's
+    global figure manager, so they are garbage-collected after save
+    without any plt.close() bookkeeping.
+    """
+    Figure, FigureCanvasAgg = _plotting()
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
 
 
 def load_config():
@@ -32,7 +71,7 @@ def load_config():
     }
     
     if not os.path.exists(config_file):
-        print(f"Warning: {config_file} not found, using default configuration")
+        log.info(f"Warning: {config_file} not found, using default configuration")
         return default_config
     
     with open(config_file, 'r') as f:
@@ -49,68 +88,181 @@ def load_config():
     return config
 
 
-def parse_value(val):
-    """Convert formatted values like '4.14T', '37.32' back to numbers"""
-    if pd.isna(val) or val == 'N/A':
-        return np.nan
-    
-    val = str(val).strip()
-    if val.endswith('T'):
-        return float(val[:-1]) * 1_000_000_000_000
-    elif val.endswith('B'):
-        return float(val[:-1]) * 1_000_000_000
-    elif val.endswith('M'):
-        return float(val[:-1]) * 1_000_000
-    else:
-        try:
-            return float(val)
-        except ValueError:
-            return np.nan
+# Number with optional T/B/M suffix, e.g. '4.14T', '37.32'; compiled once
+_VAL_RE = re.compile(r'^\s*(-?\d*\.?\d+)\s*([TBM]?)\s*$')
 
 
-def load_and_prepare_data(csv_file='csv/valuation_measures_current.csv', data_source='yahoo_finance'):
-    """Load the CSV and prepare data for visualization
-    
-    Args:
-        csv_file: Path to the CSV file
-        data_source: Which data source to use ('yahoo_finance', 'stockanalysis', or 'both')
+def parse_value_series(s):
+    """Convert a column of formatted values like '4.14T', '37.32' back to numbers
+
+    Vectorized: a single regex extract plus arithmetic, instead of one
+    Python call per cell or separate passes per suffix.
+    """
+    # One regex scan pulls the number and the optional T/B/M suffix together;
+    # 'N/A' and other junk simply fail to match and coerce to NaN
+    parts = s.astype('string').str.extract(_VAL_RE)
+    num = pd.to_numeric(parts[0], errors='coerce')
+    mult = parts[1].map({'T': 1e12, 'B': 1e9, 'M': 1e6}).fillna(1.0).astype('float64')
+    return (num * mult).astype('float64')
+
+
+@functools.lru_cache(maxsize=4)
+def _load_raw(csv_file):
+    """Read the CSV and run all numeric parsing once, for every data source.
+
+    Cached so the yahoo-only and both-sources passes in main() share one
+    read + parse instead of repeating the nine parse_value_series columns.
     """
-    df = pd.read_csv(csv_file)
-    
-    # Filter by data source (default to yahoo_finance for visualization)
-    if data_source != 'both':
-        df = df[df['Data_Source'] == data_source].copy()
-    
     # Parse numeric columns - using consolidated term names
-    numeric_cols = ['Enterprise Value', 'Market Cap', 'Enterprise Value/EBITDA', 
-                    'Enterprise Value/Revenue', 'Forward P/E', 'P/B Ratio', 
+    numeric_cols = ['Enterprise Value', 'Market Cap', 'Enterprise Value/EBITDA',
+                    'Enterprise Value/Revenue', 'Forward P/E', 'P/B Ratio',
                     'P/S Ratio', 'Trailing P/E', 'PEG Ratio']
-    
-    for col in numeric_cols:
-        if col in df.columns:
-            df[f'{col}_numeric'] = df[col].apply(parse_value)
+
+    # Read only the columns we use; the low-cardinality key columns load as
+    # category so the Data_Source/Ticker filters compare integer codes
+    df = pd.read_csv(csv_file,
+                     usecols=lambda c: c in numeric_cols
+                     or c in ('Fetch_Date', 'Ticker', 'Data_Source'),
+                     dtype={'Ticker': 'category', 'Data_Source': 'category',
+                            'Fetch_Date': 'string'})
+
+    # One assign call avoids re-fragmenting the DataFrame per added column
+    df = df.assign(**{f'{col}_numeric': parse_value_series(df[col])
+                      for col in numeric_cols if col in df.columns})
     
     # Calculate VCR (Valuation Compression Ratio) = Forward P/E / Trailing P/E
     # VCR < 1 means market expects earnings growth (forward earnings higher than trailing)
     # VCR > 1 means market expects earnings decline
     df['VCR_numeric'] = df['Forward P/E_numeric'] / df['Trailing P/E_numeric']
-    df['VCR'] = df['VCR_numeric'].apply(lambda x: f"{x:.3f}" if not pd.isna(x) else "N/A")
-    
+    # Format the whole column in one C pass instead of a per-row lambda
+    vcr = df['VCR_numeric'].to_numpy()
+    vcr_formatted = np.char.mod('%.3f', vcr).astype(object)
+    vcr_formatted[np.isnan(vcr)] = 'N/A'
+    df['VCR'] = vcr_formatted
+
     # Filter by configured tickers if specified
     config = load_config()
     if config.get('tickers') and len(config['tickers']) > 0:
-        df = df[df['Ticker'].isin(config['tickers'])].copy()
+        df = df[df['Ticker'].isin(config['tickers'])]
         if not df.empty:
-            print(f"Filtered to configured tickers: {', '.join(sorted(df['Ticker'].unique()))}")
-    
+            log.info(f"Filtered to configured tickers: {', '.join(sorted(df['Ticker'].unique()))}")
+
     return df
 
 
-def create_visualizations(df, version_suffix=''):
-    """Create comprehensive visualizations"""
-    
+def load_and_prepare_data(csv_file='csv/valuation_measures_current.csv', data_source='yahoo_finance'):
+    """Load the CSV and prepare data for visualization
+
+    Args:
+        csv_file: Path to the CSV file
+        data_source: Which data source to use ('yahoo_finance', 'stockanalysis', or 'both')
+    """
+    df = _load_raw(csv_file)
+
+    # Filter by data source (default to yahoo_finance for visualization).
+    # Copy-on-write keeps the cached frame safe: callers get a cheap view
+    # and pandas only materializes a copy if they actually write to it
+    if data_source != 'both':
+        return df[df['Data_Source'].eq(data_source)]
+    return df
+
+
+# Banner separators, built once instead of on every status line
+SEP_EQ = '=' * 80
+SEP_DASH = '-' * 80
+
+# Tableau 10 palette used for per-company bar colors
+TABLEAU10 = ('#4E79A7', '#F28E2B', '#E15759', '#76B7B2', '#59A14F',
+             '#EDC948', '#B07AA1', '#FF9DA7', '#9C755F', '#BAB0AC')
+
+
+@functools.lru_cache(maxsize=8)
+def ticker_color_map(tickers):
+    """Map a tuple of tickers to Tableau 10 colors, alphabetically.
+
+    Cached: every figure for the same ticker set reuses one dict, and the
+    alphabetical assignment keeps colors stable across v1/v2/consolidated
+    renders that share tickers.
+    """
+    return {ticker: TABLEAU10[i % len(TABLEAU10)]
+            for i, ticker in enumerate(sorted(tickers))}
+
+
+# Panels 2-9 of the main figure are the same sorted horizontal-bar chart
+# with different columns, labels, formats and label offsets
+_BARH_PANEL_SPECS = [
+    {'pos': 2, 'col': 'VCR_numeric', 'xlabel': 'VCR Ratio (Forward P/E / Trailing P/E)',
+     'title': 'VCR - Valuation Compression Ratio\n<1: Growth | >1: Decline',
+     'fmt': '{:.3f}', 'dropna': True, 'min_offset': 0.02, 'vcr_line': True},
+    {'pos': 3, 'col': 'PEG Ratio_numeric', 'xlabel': 'PEG Ratio',
+     'title': 'PEG Ratio (5yr expected)\nLower = Better Value',
+     'fmt': '{:.2f}', 'dropna': True, 'min_offset': 0.2},
+    {'pos': 4, 'col': 'Market Cap_numeric', 'xlabel': 'Market Cap (Trillions $)',
+     'title': 'Market Capitalization', 'fmt': '${:.2f}T', 'scale': 1e-12, 'min_offset': 0.06},
+    {'pos': 5, 'col': 'Enterprise Value_numeric', 'xlabel': 'Enterprise Value (Trillions $)',
+     'title': 'Enterprise Value', 'fmt': '${:.2f}T', 'scale': 1e-12, 'min_offset': 0.06},
+    {'pos': 6, 'col': 'P/S Ratio_numeric', 'xlabel': 'Price/Sales Ratio',
+     'title': 'Price/Sales (TTM)', 'fmt': '{:.2f}', 'min_offset': 0.3},
+    {'pos': 7, 'col': 'P/B Ratio_numeric', 'xlabel': 'Price/Book Ratio',
+     'title': 'Price/Book (MRQ)', 'fmt': '{:.2f}', 'min_offset': 1.0},
+    {'pos': 8, 'col': 'Enterprise Value/Revenue_numeric', 'xlabel': 'EV/Revenue Ratio',
+     'title': 'Enterprise Value / Revenue', 'fmt': '{:.2f}', 'min_offset': 0.3},
+    {'pos': 9, 'col': 'Enterprise Value/EBITDA_numeric', 'xlabel': 'EV/EBITDA Ratio',
+     'title': 'Enterprise Value / EBITDA', 'fmt': '{:.2f}', 'min_offset': 2.0},
+]
+
+
+def draw_barh_panel(ax, col_vals, ticker_arr, order, spec, ticker_colors):
+    """Draw one sorted horizontal-bar panel of create_visualizations.
+
+    Takes the raw column array plus its precomputed argsort permutation,
+    so drawing is an index view - no per-panel DataFrame sort or copy.
+    """
+    if spec.get('dropna'):
+        # argsort puts NaN last; truncating the permutation drops them
+        order = order[:np.count_nonzero(~np.isnan(col_vals))]
+
+    vals = col_vals[order] * spec.get('scale', 1.0)
+    tickers = ticker_arr[order]
+    bar_colors = [ticker_colors[ticker] for ticker in tickers]
+    y_pos = np.arange(len(vals))
+
+    ax.barh(y_pos, vals, color=bar_colors, alpha=0.8, edgecolor='black', linewidth=1.2)
+    ax.set_xlabel(spec['xlabel'], fontsize=10)
+    ax.set_title(spec['title'], fontweight='bold', fontsize=11)
+    if spec.get('vcr_line'):
+        ax.axvline(x=1.0, color='#E15759', linestyle='--', linewidth=2, label='VCR=1.0')
+        ax.legend(loc='best', fontsize=9)
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(tickers, fontsize=10)
+    ax.grid(axis='x', alpha=0.4, linestyle='--', linewidth=0.5)
+
+    # Dynamic offset: 4% of data range + minimum offset
+    offset = max(np.nanmax(vals) - np.nanmin(vals), 0) * 0.04
+    offset = max(offset, spec['min_offset'])
+    label = spec['fmt'].format
+    for i, val in enumerate(vals):
+        if not pd.isna(val):
+            ax.text(val + offset, i, label(val),
+                    va='center', ha='left', fontsize=9, fontweight='bold')
+
+
+def create_visualizations(df, version='v1', fig=None, dpi=150):
+    """Create comprehensive visualizations
+
+    Args:
+        df: Prepared valuation frame for one data source
+        version: 'v1' for all companies, 'v2' for filtered; names the
+            output file — inferring it from row count mislabeled the
+            filtered render whenever the exclusions left >= 7 tickers
+        fig: Optional Figure to clear and reuse; back-to-back v1/v2
+            renders then skip re-allocating the 10-axes 16x16 canvas
+    """
     # Create a figure with multiple subplots (4 rows x 3 columns for VCR chart)
-    fig = plt.figure(figsize=(16, 16))
+    if fig is None:
+        fig = make_figure(figsize=(16, 16))
+    else:
+        fig.clear()
     
     # Get the fetch date and data source from the data
     fetch_date = df['Fetch_Date'].iloc[0] if 'Fetch_Date' in df.columns else datetime.now().strftime('%Y-%m-%d')
@@ -136,19 +288,18 @@ def create_visualizations(df, version_suffix=''):
     
     fig.suptitle(title, fontsize=16, fontweight='bold', y=0.995)
     
-    # Define consistent color mapping for each company (sub-figures 2-9) using Tableau 10 colors
-    # Sort tickers to ensure consistent color assignment
-    all_tickers = sorted(df['Ticker'].unique())
-    tableau_colors = ['#4E79A7', '#F28E2B', '#E15759', '#76B7B2', '#59A14F', '#EDC948', '#B07AA1', '#FF9DA7', '#9C755F', '#BAB0AC']
-    ticker_colors = {ticker: tableau_colors[i % len(tableau_colors)] for i, ticker in enumerate(all_tickers)}
+    # Consistent color mapping for each company (sub-figures 2-9)
+    ticker_colors = ticker_color_map(tuple(df['Ticker'].unique()))
     
     # TOP 1: P/E Ratios Comparison (Position 1 - Top Left)
-    ax1 = plt.subplot(4, 3, 1)
+    ax1 = fig.add_subplot(4, 3, 1)
     x = np.arange(len(df))
     width = 0.35
-    trailing_pe = df.sort_values('Ticker')['Trailing P/E_numeric']
-    forward_pe = df.sort_values('Ticker')['Forward P/E_numeric']
-    tickers = df.sort_values('Ticker')['Ticker']
+    # Sort once; three sort_values calls meant three full sorts + copies
+    df_sorted = df.sort_values('Ticker')
+    trailing_pe = df_sorted['Trailing P/E_numeric'].to_numpy()
+    forward_pe = df_sorted['Forward P/E_numeric'].to_numpy()
+    tickers = df_sorted['Ticker'].to_numpy()
     
     ax1.bar(x - width/2, trailing_pe, width, label='Trailing P/E', alpha=0.8)
     ax1.bar(x + width/2, forward_pe, width, label='Forward P/E', alpha=0.8)
@@ -159,182 +310,18 @@ def create_visualizations(df, version_suffix=''):
     ax1.legend()
     ax1.grid(axis='y', alpha=0.3)
     
-    # TOP 2: VCR - Valuation Compression Ratio (Position 2 - Top Center)
-    ax2 = plt.subplot(4, 3, 2)
-    vcr_sorted = df.sort_values('VCR_numeric', ascending=True).dropna(subset=['VCR_numeric'])
-    
-    # Use consistent colors for each company - horizontal bars
-    bar_colors = [ticker_colors[ticker] for ticker in vcr_sorted['Ticker']]
-    y_pos = np.arange(len(vcr_sorted))
-    ax2.barh(y_pos, vcr_sorted['VCR_numeric'], color=bar_colors, alpha=0.8, edgecolor='black', linewidth=1.2)
-    
-    ax2.set_xlabel('VCR Ratio (Forward P/E / Trailing P/E)', fontsize=10)
-    ax2.set_title('VCR - Valuation Compression Ratio\n<1: Growth | >1: Decline', 
-                  fontweight='bold', fontsize=11)
-    ax2.axvline(x=1.0, color='#E15759', linestyle='--', linewidth=2, label='VCR=1.0')
-    ax2.set_yticks(y_pos)
-    ax2.set_yticklabels(vcr_sorted['Ticker'], fontsize=10)
-    ax2.grid(axis='x', alpha=0.4, linestyle='--', linewidth=0.5)
-    ax2.legend(loc='best', fontsize=9)
-    
-    # Dynamic offset: 4% of data range + minimum offset
-    vcr_range = vcr_sorted['VCR_numeric'].max() - vcr_sorted['VCR_numeric'].min()
-    vcr_offset = max(vcr_range * 0.04, 0.02)
-    for i, (idx, row) in enumerate(vcr_sorted.iterrows()):
-        if not pd.isna(row['VCR_numeric']):
-            ax2.text(row['VCR_numeric'] + vcr_offset, i, 
-                    f"{row['VCR_numeric']:.3f}", 
-                    va='center', ha='left', fontsize=9, fontweight='bold')
-    
-    # TOP 3: PEG Ratio (Position 3 - Top Right)
-    ax3 = plt.subplot(4, 3, 3)
-    peg_sorted = df.sort_values('PEG Ratio_numeric', ascending=True).dropna(subset=['PEG Ratio_numeric'])
-    bar_colors = [ticker_colors[ticker] for ticker in peg_sorted['Ticker']]
-    y_pos = np.arange(len(peg_sorted))
-    ax3.barh(y_pos, peg_sorted['PEG Ratio_numeric'], color=bar_colors, alpha=0.8, edgecolor='black', linewidth=1.2)
-    ax3.set_xlabel('PEG Ratio', fontsize=10)
-    ax3.set_title('PEG Ratio (5yr expected)\nLower = Better Value', fontweight='bold', fontsize=11)
-    ax3.set_yticks(y_pos)
-    ax3.set_yticklabels(peg_sorted['Ticker'], fontsize=10)
-    ax3.grid(axis='x', alpha=0.4, linestyle='--', linewidth=0.5)
-    
-    # Dynamic offset: 4% of data range + minimum offset
-    peg_range = peg_sorted['PEG Ratio_numeric'].max() - peg_sorted['PEG Ratio_numeric'].min()
-    peg_offset = max(peg_range * 0.04, 0.2)
-    for i, (idx, row) in enumerate(peg_sorted.iterrows()):
-        if not pd.isna(row['PEG Ratio_numeric']):
-            ax3.text(row['PEG Ratio_numeric'] + peg_offset, i, 
-                    f"{row['PEG Ratio_numeric']:.2f}", 
-                    va='center', ha='left', fontsize=9, fontweight='bold')
-    
-    # 4. Market Cap Comparison (Position 4 - Row 2 Left)
-    ax4 = plt.subplot(4, 3, 4)
-    market_caps = df.sort_values('Market Cap_numeric', ascending=True)
-    bar_colors = [ticker_colors[ticker] for ticker in market_caps['Ticker']]
-    y_pos = np.arange(len(market_caps))
-    ax4.barh(y_pos, market_caps['Market Cap_numeric'] / 1e12, color=bar_colors, alpha=0.8, edgecolor='black', linewidth=1.2)
-    ax4.set_xlabel('Market Cap (Trillions $)', fontsize=10)
-    ax4.set_title('Market Capitalization', fontweight='bold', fontsize=11)
-    ax4.set_yticks(y_pos)
-    ax4.set_yticklabels(market_caps['Ticker'], fontsize=10)
-    ax4.grid(axis='x', alpha=0.4, linestyle='--', linewidth=0.5)
-    
-    # Dynamic offset: 4% of data range + minimum offset
-    mc_range = (market_caps['Market Cap_numeric'].max() - market_caps['Market Cap_numeric'].min()) / 1e12
-    mc_offset = max(mc_range * 0.04, 0.06)
-    for i, (idx, row) in enumerate(market_caps.iterrows()):
-        if not pd.isna(row['Market Cap_numeric']):
-            ax4.text(row['Market Cap_numeric'] / 1e12 + mc_offset, i, 
-                    f"${row['Market Cap_numeric']/1e12:.2f}T", 
-                    va='center', ha='left', fontsize=9, fontweight='bold')
-    
-    # 5. Enterprise Value Comparison (Position 5 - Row 2 Center)
-    ax5 = plt.subplot(4, 3, 5)
-    ev_sorted = df.sort_values('Enterprise Value_numeric', ascending=True)
-    bar_colors = [ticker_colors[ticker] for ticker in ev_sorted['Ticker']]
-    y_pos = np.arange(len(ev_sorted))
-    ax5.barh(y_pos, ev_sorted['Enterprise Value_numeric'] / 1e12, color=bar_colors, alpha=0.8, edgecolor='black', linewidth=1.2)
-    ax5.set_xlabel('Enterprise Value (Trillions $)', fontsize=10)
-    ax5.set_title('Enterprise Value', fontweight='bold', fontsize=11)
-    ax5.set_yticks(y_pos)
-    ax5.set_yticklabels(ev_sorted['Ticker'], fontsize=10)
-    ax5.grid(axis='x', alpha=0.4, linestyle='--', linewidth=0.5)
-    
-    # Dynamic offset: 4% of data range + minimum offset
-    ev_range = (ev_sorted['Enterprise Value_numeric'].max() - ev_sorted['Enterprise Value_numeric'].min()) / 1e12
-    ev_offset = max(ev_range * 0.04, 0.06)
-    for i, (idx, row) in enumerate(ev_sorted.iterrows()):
-        if not pd.isna(row['Enterprise Value_numeric']):
-            ax5.text(row['Enterprise Value_numeric'] / 1e12 + ev_offset, i, 
-                    f"${row['Enterprise Value_numeric']/1e12:.2f}T", 
-                    va='center', ha='left', fontsize=9, fontweight='bold')
-    
-    # 6. Price/Sales (Position 6 - Row 2 Right)
-    ax6 = plt.subplot(4, 3, 6)
-    ps_sorted = df.sort_values('P/S Ratio_numeric', ascending=True)
-    bar_colors = [ticker_colors[ticker] for ticker in ps_sorted['Ticker']]
-    y_pos = np.arange(len(ps_sorted))
-    ax6.barh(y_pos, ps_sorted['P/S Ratio_numeric'], color=bar_colors, alpha=0.8, edgecolor='black', linewidth=1.2)
-    ax6.set_xlabel('Price/Sales Ratio', fontsize=10)
-    ax6.set_title('Price/Sales (TTM)', fontweight='bold', fontsize=11)
-    ax6.set_yticks(y_pos)
-    ax6.set_yticklabels(ps_sorted['Ticker'], fontsize=10)
-    ax6.grid(axis='x', alpha=0.4, linestyle='--', linewidth=0.5)
-    
-    # Dynamic offset: 4% of data range + minimum offset
-    ps_range = ps_sorted['P/S Ratio_numeric'].max() - ps_sorted['P/S Ratio_numeric'].min()
-    ps_offset = max(ps_range * 0.04, 0.3)
-    for i, (idx, row) in enumerate(ps_sorted.iterrows()):
-        if not pd.isna(row['P/S Ratio_numeric']):
-            ax6.text(row['P/S Ratio_numeric'] + ps_offset, i, 
-                    f"{row['P/S Ratio_numeric']:.2f}", 
-                    va='center', ha='left', fontsize=9, fontweight='bold')
-    
-    # 7. Price/Book Ratio (Position 7 - Row 3 Left)
-    ax7 = plt.subplot(4, 3, 7)
-    pb_sorted = df.sort_values('P/B Ratio_numeric', ascending=True)
-    bar_colors = [ticker_colors[ticker] for ticker in pb_sorted['Ticker']]
-    y_pos = np.arange(len(pb_sorted))
-    ax7.barh(y_pos, pb_sorted['P/B Ratio_numeric'], color=bar_colors, alpha=0.8, edgecolor='black', linewidth=1.2)
-    ax7.set_xlabel('Price/Book Ratio', fontsize=10)
-    ax7.set_title('Price/Book (MRQ)', fontweight='bold', fontsize=11)
-    ax7.set_yticks(y_pos)
-    ax7.set_yticklabels(pb_sorted['Ticker'], fontsize=10)
-    ax7.grid(axis='x', alpha=0.4, linestyle='--', linewidth=0.5)
-    
-    # Dynamic offset: 4% of data range + minimum offset
-    pb_range = pb_sorted['P/B Ratio_numeric'].max() - pb_sorted['P/B Ratio_numeric'].min()
-    pb_offset = max(pb_range * 0.04, 1.0)
-    for i, (idx, row) in enumerate(pb_sorted.iterrows()):
-        if not pd.isna(row['P/B Ratio_numeric']):
-            ax7.text(row['P/B Ratio_numeric'] + pb_offset, i, 
-                    f"{row['P/B Ratio_numeric']:.2f}", 
-                    va='center', ha='left', fontsize=9, fontweight='bold')
-    
-    # 8. Enterprise Value/Revenue (Position 8 - Row 3 Center)
-    ax8 = plt.subplot(4, 3, 8)
-    evr_sorted = df.sort_values('Enterprise Value/Revenue_numeric', ascending=True)
-    bar_colors = [ticker_colors[ticker] for ticker in evr_sorted['Ticker']]
-    y_pos = np.arange(len(evr_sorted))
-    ax8.barh(y_pos, evr_sorted['Enterprise Value/Revenue_numeric'], color=bar_colors, alpha=0.8, edgecolor='black', linewidth=1.2)
-    ax8.set_xlabel('EV/Revenue Ratio', fontsize=10)
-    ax8.set_title('Enterprise Value / Revenue', fontweight='bold', fontsize=11)
-    ax8.set_yticks(y_pos)
-    ax8.set_yticklabels(evr_sorted['Ticker'], fontsize=10)
-    ax8.grid(axis='x', alpha=0.4, linestyle='--', linewidth=0.5)
-    
-    # Dynamic offset: 4% of data range + minimum offset
-    evr_range = evr_sorted['Enterprise Value/Revenue_numeric'].max() - evr_sorted['Enterprise Value/Revenue_numeric'].min()
-    evr_offset = max(evr_range * 0.04, 0.3)
-    for i, (idx, row) in enumerate(evr_sorted.iterrows()):
-        if not pd.isna(row['Enterprise Value/Revenue_numeric']):
-            ax8.text(row['Enterprise Value/Revenue_numeric'] + evr_offset, i, 
-                    f"{row['Enterprise Value/Revenue_numeric']:.2f}", 
-                    va='center', ha='left', fontsize=9, fontweight='bold')
-    
-    # 9. Enterprise Value/EBITDA (Position 9 - Row 3 Right)
-    ax9 = plt.subplot(4, 3, 9)
-    evebitda_sorted = df.sort_values('Enterprise Value/EBITDA_numeric', ascending=True)
-    bar_colors = [ticker_colors[ticker] for ticker in evebitda_sorted['Ticker']]
-    y_pos = np.arange(len(evebitda_sorted))
-    ax9.barh(y_pos, evebitda_sorted['Enterprise Value/EBITDA_numeric'], color=bar_colors, alpha=0.8, edgecolor='black', linewidth=1.2)
-    ax9.set_xlabel('EV/EBITDA Ratio', fontsize=10)
-    ax9.set_title('Enterprise Value / EBITDA', fontweight='bold', fontsize=11)
-    ax9.set_yticks(y_pos)
-    ax9.set_yticklabels(evebitda_sorted['Ticker'], fontsize=10)
-    ax9.grid(axis='x', alpha=0.4, linestyle='--', linewidth=0.5)
-    
-    # Dynamic offset: 4% of data range + minimum offset
-    evebitda_range = evebitda_sorted['Enterprise Value/EBITDA_numeric'].max() - evebitda_sorted['Enterprise Value/EBITDA_numeric'].min()
-    evebitda_offset = max(evebitda_range * 0.04, 2.0)
-    for i, (idx, row) in enumerate(evebitda_sorted.iterrows()):
-        if not pd.isna(row['Enterprise Value/EBITDA_numeric']):
-            ax9.text(row['Enterprise Value/EBITDA_numeric'] + evebitda_offset, i, 
-                    f"{row['Enterprise Value/EBITDA_numeric']:.2f}", 
-                    va='center', ha='left', fontsize=9, fontweight='bold')
-    
+    # Panels 2-9: one data-driven loop over the shared horizontal-bar spec.
+    # Pull each column out once and keep its sort as a permutation array
+    ticker_arr = df['Ticker'].to_numpy()
+    panel_arrays = {spec['col']: df[spec['col']].to_numpy() for spec in _BARH_PANEL_SPECS}
+    orders = {col: np.argsort(arr, kind='stable') for col, arr in panel_arrays.items()}
+    for spec in _BARH_PANEL_SPECS:
+        col = spec['col']
+        draw_barh_panel(fig.add_subplot(4, 3, spec['pos']),
+                        panel_arrays[col], ticker_arr, orders[col], spec, ticker_colors)
+
     # 10. Valuation Multiples Heatmap (Bottom Row - spanning 3 columns)
-    ax10 = plt.subplot(4, 3, (10, 12))
+    ax10 = fig.add_subplot(4, 3, (10, 12))
     
     # Create heatmap data including PEG Ratio
     heatmap_cols = ['Trailing P/E_numeric', 'Forward P/E_numeric', 'VCR_numeric', 'PEG Ratio_numeric',
@@ -342,20 +329,42 @@ def create_visualizations(df, version_suffix=''):
                     'Enterprise Value/Revenue_numeric', 'Enterprise Value/EBITDA_numeric']
     heatmap_labels = ['Trailing P/E', 'Forward P/E', 'VCR', 'PEG', 'P/S', 'P/B', 'EV/Rev', 'EV/EBITDA']
     
-    heatmap_data = df.set_index('Ticker')[heatmap_cols].copy()
+    heatmap_data = df.set_index('Ticker')[heatmap_cols]
     heatmap_data.columns = heatmap_labels
     
-    # Normalize each column for better visualization (0-1 scale)
-    heatmap_normalized = (heatmap_data - heatmap_data.min()) / (heatmap_data.max() - heatmap_data.min())
-    
-    sns.heatmap(heatmap_normalized.T, annot=heatmap_data.T, fmt='.2f', 
-                cmap='RdYlGn_r', cbar_kws={'label': 'Relative Valuation'}, 
-                ax=ax10, linewidths=0.5)
+    # Normalize each column for better visualization (0-1 scale).
+    # One NumPy pass instead of five DataFrame-wide ops; NaN-safe and
+    # guarded against constant columns (zero range)
+    arr = heatmap_data.to_numpy(dtype=np.float64, copy=False)
+    col_min = np.nanmin(arr, axis=0)
+    col_max = np.nanmax(arr, axis=0)
+    norm = (arr - col_min) / np.where(col_max > col_min, col_max - col_min, 1.0)
+    heatmap_normalized = pd.DataFrame(norm, index=heatmap_data.index,
+                                      columns=heatmap_data.columns)
+    
+    # Raw imshow instead of sns.heatmap: skips seaborn's QuadMesh and
+    # per-cell dispatch while keeping the same colors and annotations
+    norm_T = heatmap_normalized.T.to_numpy()
+    ax10.grid(False)  # no whitegrid lines across the image cells
+    im = ax10.imshow(norm_T, cmap='RdYlGn_r', aspect='auto', vmin=0.0, vmax=1.0)
+    fig.colorbar(im, ax=ax10, label='Relative Valuation')
+
+    annot_T = heatmap_data.T.to_numpy()
+    for (i, j), val in np.ndenumerate(annot_T):
+        if not np.isnan(val):
+            # White text on the extreme (dark) cells, like seaborn does
+            color = 'white' if norm_T[i, j] > 0.85 or norm_T[i, j] < 0.15 else 'black'
+            ax10.text(j, i, f'{val:.2f}', ha='center', va='center', fontsize=9, color=color)
+
+    ax10.set_xticks(np.arange(annot_T.shape[1]))
+    ax10.set_xticklabels(heatmap_data.index, fontsize=10)
+    ax10.set_yticks(np.arange(annot_T.shape[0]))
+    ax10.set_yticklabels(heatmap_labels, fontsize=10)
     ax10.set_title('Valuation Multiples Heatmap (Lower = Better Value)', fontweight='bold')
     ax10.set_xlabel('')
     ax10.set_ylabel('Metric')
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Create pic directory with date-specific subdirectory
     timestamp = datetime.now().strftime('%Y_%m%d')
@@ -365,48 +374,92 @@ def create_visualizations(df, version_suffix=''):
     # Generate filename with data source
     data_source = df['Data_Source'].iloc[0] if 'Data_Source' in df.columns else 'yahoo_finance'
     
-    # Add version suffix if filtered
-    if len(df) < 7:
-        excluded = list(set(['AAPL', 'MSFT', 'GOOG', 'AMZN', 'META', 'NVDA', 'TSLA']) - set(df['Ticker'].tolist()))
-        suffix = '_v2'
-        #! Commented out this
-        # suffix = f"_v2_no_{'_'.join(excluded)}"
-    else:
-        suffix = '_v1'
-    
-    output_file = os.path.join(pic_dir, f'{data_source}{suffix}.png')
+    output_file = os.path.join(pic_dir, f'{data_source}_{version}.png')
     
     # Save the figure
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    print(f"\n✓ Saved comprehensive visualization to: {output_file}")
+    # compress_level=1: near-instant PNG encoding, marginally larger files
+    fig.savefig(output_file, dpi=dpi, bbox_inches='tight',
+                pil_kwargs={'compress_level': 1})
+    log.info(f"\n✓ Saved comprehensive visualization to: {output_file}")
     
     return fig
 
 
-def create_consolidated_visualizations(df_full, version='v1'):
+# (label, numeric column) pairs shown in the consolidated figures,
+# Fig 01 through Fig 06; merge_sources joins only these columns
+CONSOLIDATED_METRICS = (
+    ('Trailing P/E', 'Trailing P/E_numeric'),
+    ('Forward P/E', 'Forward P/E_numeric'),
+    ('VCR', 'VCR_numeric'),
+    ('PEG Ratio', 'PEG Ratio_numeric'),
+    ('P/S Ratio', 'P/S Ratio_numeric'),
+    ('P/B Ratio', 'P/B Ratio_numeric')
+)
+
+
+def merge_sources(df_full):
+    """Join the yahoo and stockanalysis rows of df_full side by side.
+
+    Cached per input frame: the consolidated and consolidated-mean
+    figures for the same version both need this table, so the second
+    caller reuses the first join. DataFrames are not hashable, so the
+    cache holds the last few (source, join) pairs — pinning a source
+    keeps its id() live, and hits verify identity against the caller's
+    frame, so a recycled id can never serve a stale join. Bounded LRU:
+    a fresh frame evicts the oldest pair rather than pinning every
+    frame ever seen. Callers must not mutate the result.
+    """
+    key = id(df_full)
+    entry = _MERGED_CACHE.get(key)
+    if entry is not None and entry[0] is df_full:
+        _MERGED_CACHE[key] = _MERGED_CACHE.pop(key)  # mark most recent
+        return entry[1]
+
+    # Project down to the join key plus the six plotted metrics before
+    # joining; the remaining wide columns never reach the figures
+    cols = ['Ticker', *(col for _, col in CONSOLIDATED_METRICS)]
+    df_yahoo = df_full.loc[df_full['Data_Source'].eq('yahoo_finance'), cols]
+    df_sa = df_full.loc[df_full['Data_Source'].eq('stockanalysis'), cols]
+    # Index join: both sides hold the same few unique keys, so this
+    # skips merge's hash-join and suffix special-casing
+    df_merged = (df_yahoo.set_index('Ticker').add_suffix('_yahoo')
+                 .join(df_sa.set_index('Ticker').add_suffix('_sa'), how='inner')
+                 .reset_index())
+    while len(_MERGED_CACHE) >= _MERGED_CACHE_SIZE:
+        _MERGED_CACHE.pop(next(iter(_MERGED_CACHE)))
+    _MERGED_CACHE[key] = (df_full, df_merged)
+    return df_merged
+
+
+_MERGED_CACHE = {}
+_MERGED_CACHE_SIZE = 4  # matches the _load_raw lru_cache bound
+
+
+def create_consolidated_visualizations(df_full, version='v1', dpi=150, exclude_tickers=()):
     """Create consolidated visualizations comparing Yahoo Finance vs StockAnalysis
     
     Args:
         df_full: Full dataframe with both data sources
         version: 'v1' for all companies, 'v2' for filtered (no TSLA)
+        exclude_tickers: Tickers to drop from the merged table; filtering
+            after the cached join lets v2 reuse the v1 join instead of
+            re-joining a pre-filtered frame
     """
-    # Filter data for both sources
-    df_yahoo = df_full[df_full['Data_Source'] == 'yahoo_finance'].copy()
-    df_sa = df_full[df_full['Data_Source'] == 'stockanalysis'].copy()
-    
-    # Merge on Ticker to get side-by-side comparison
-    df_merged = pd.merge(df_yahoo, df_sa, on='Ticker', suffixes=('_yahoo', '_sa'))
+    df_merged = merge_sources(df_full)
+    if exclude_tickers:
+        df_merged = df_merged[~df_merged['Ticker'].isin(exclude_tickers)]
     
     # Create figure with 6 subplots (2x3)
-    fig, axes = plt.subplots(2, 3, figsize=(20, 12))
-    
+    fig = make_figure(figsize=(20, 12))
+    axes = fig.subplots(2, 3)
+
     # Get fetch date from the data
     fetch_date = df_full['Fetch_Date'].iloc[0] if 'Fetch_Date' in df_full.columns else datetime.now().strftime('%Y-%m-%d')
-    
+
     # Determine title based on version
     num_companies = len(df_merged)
     config = load_config()
-    
+
     if version == 'v2':
         exclude_tickers = config.get('exclude_from_visualizations', [])
         excluded_list = ', '.join(exclude_tickers) if exclude_tickers else ''
@@ -417,14 +470,7 @@ def create_consolidated_visualizations(df_full, version='v1'):
     fig.suptitle(title, fontsize=16, fontweight='bold')
     
     # Define the 6 metrics to visualize (in display order)
-    metrics = [
-        ('Trailing P/E', 'Trailing P/E_numeric'),   # Fig 01
-        ('Forward P/E', 'Forward P/E_numeric'),     # Fig 02
-        ('VCR', 'VCR_numeric'),                     # Fig 03
-        ('PEG Ratio', 'PEG Ratio_numeric'),         # Fig 04
-        ('P/S Ratio', 'P/S Ratio_numeric'),         # Fig 05
-        ('P/B Ratio', 'P/B Ratio_numeric')          # Fig 06
-    ]
+    metrics = CONSOLIDATED_METRICS
     
     # Color scheme - Tableau colors
     colors_yahoo = '#4E79A7'  # Tableau Blue
@@ -472,23 +518,18 @@ def create_consolidated_visualizations(df_full, version='v1'):
         offset = max(data_range * 0.025, min_offset)
         
         # Add value labels (adjust format for VCR which uses 3 decimals)
-        for i, (_, row) in enumerate(df_plot.iterrows()):
-            if not pd.isna(row[col_yahoo]):
-                if title == 'VCR':
-                    label_text = f"{row[col_yahoo]:.3f}"
-                else:
-                    label_text = f"{row[col_yahoo]:.2f}"
-                ax.text(row[col_yahoo] + offset, i - width/2, label_text, 
+        fmt = '{:.3f}' if title == 'VCR' else '{:.2f}'
+        yahoo_vals = df_plot[col_yahoo].to_numpy()
+        sa_vals = df_plot[col_sa].to_numpy()
+        for i, (val_yahoo, val_sa) in enumerate(zip(yahoo_vals, sa_vals)):
+            if not pd.isna(val_yahoo):
+                ax.text(val_yahoo + offset, i - width/2, fmt.format(val_yahoo),
                        va='center', ha='left', fontsize=8, color=colors_yahoo)
-            if not pd.isna(row[col_sa]):
-                if title == 'VCR':
-                    label_text = f"{row[col_sa]:.3f}"
-                else:
-                    label_text = f"{row[col_sa]:.2f}"
-                ax.text(row[col_sa] + offset, i + width/2, label_text, 
+            if not pd.isna(val_sa):
+                ax.text(val_sa + offset, i + width/2, fmt.format(val_sa),
                        va='center', ha='left', fontsize=8, color=colors_sa)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Create pic directory with date-specific subdirectory
     timestamp = datetime.now().strftime('%Y_%m%d')
@@ -499,37 +540,37 @@ def create_consolidated_visualizations(df_full, version='v1'):
     output_file = os.path.join(pic_dir, f'consolidated_separated_{version}.png')
     
     # Save the figure
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    print(f"\n✓ Saved consolidated visualization to: {output_file}")
+    # compress_level=1: near-instant PNG encoding, marginally larger files
+    fig.savefig(output_file, dpi=dpi, bbox_inches='tight',
+                pil_kwargs={'compress_level': 1})
+    log.info(f"\n✓ Saved consolidated visualization to: {output_file}")
     
     return fig
 
 
-def create_consolidated_mean_visualizations(df_full, version='v1'):
+def create_consolidated_mean_visualizations(df_full, version='v1', dpi=150, exclude_tickers=()):
     """Create consolidated mean visualizations showing average of both sources
     
     Args:
         df_full: Full dataframe with both data sources
         version: 'v1' for all companies, 'v2' for filtered (no TSLA)
+        exclude_tickers: Tickers to drop from the merged table after the
+            cached join, so v2 shares the v1 join
     """
-    # Filter data for both sources
-    df_yahoo = df_full[df_full['Data_Source'] == 'yahoo_finance'].copy()
-    df_sa = df_full[df_full['Data_Source'] == 'stockanalysis'].copy()
-    
-    # Merge on Ticker to get side-by-side comparison
-    df_merged = pd.merge(df_yahoo, df_sa, on='Ticker', suffixes=('_yahoo', '_sa'))
+    df_merged = merge_sources(df_full)
+    if exclude_tickers:
+        df_merged = df_merged[~df_merged['Ticker'].isin(exclude_tickers)]
     
     # Get fetch date from the data
     fetch_date = df_full['Fetch_Date'].iloc[0] if 'Fetch_Date' in df_full.columns else datetime.now().strftime('%Y-%m-%d')
     
-    # Create consistent color mapping for each company using Tableau 10 colors
-    all_tickers = sorted(df_merged['Ticker'].unique())
-    tableau_colors = ['#4E79A7', '#F28E2B', '#E15759', '#76B7B2', '#59A14F', '#EDC948', '#B07AA1', '#FF9DA7', '#9C755F', '#BAB0AC']
-    ticker_colors = {ticker: tableau_colors[i % len(tableau_colors)] for i, ticker in enumerate(all_tickers)}
+    # Consistent color mapping for each company
+    ticker_colors = ticker_color_map(tuple(df_merged['Ticker'].unique()))
     
     # Create figure with 6 subplots (2x3)
-    fig, axes = plt.subplots(2, 3, figsize=(20, 12))
-    
+    fig = make_figure(figsize=(20, 12))
+    axes = fig.subplots(2, 3)
+
     # Determine title based on version
     num_companies = len(df_merged)
     config = load_config()
@@ -544,44 +585,39 @@ def create_consolidated_mean_visualizations(df_full, version='v1'):
     fig.suptitle(title, fontsize=16, fontweight='bold')
     
     # Define the 6 metrics to visualize (in display order)
-    metrics = [
-        ('Trailing P/E', 'Trailing P/E_numeric'),   # Fig 01
-        ('Forward P/E', 'Forward P/E_numeric'),     # Fig 02
-        ('VCR', 'VCR_numeric'),                     # Fig 03
-        ('PEG Ratio', 'PEG Ratio_numeric'),         # Fig 04
-        ('P/S Ratio', 'P/S Ratio_numeric'),         # Fig 05
-        ('P/B Ratio', 'P/B Ratio_numeric')          # Fig 06
-    ]
-    
+    metrics = CONSOLIDATED_METRICS
+    
+    # Average both sources for all six metrics in one stacked reduction,
+    # instead of six DataFrame.mean(axis=1) assignments inside the loop
+    yahoo_vals = df_merged[[base + '_yahoo' for _, base in metrics]].to_numpy()
+    sa_vals = df_merged[[base + '_sa' for _, base in metrics]].to_numpy()
+    means = np.nanmean(np.stack([yahoo_vals, sa_vals]), axis=0)
+    all_tickers_arr = df_merged['Ticker'].to_numpy()
+
     for idx, (title_text, col_base) in enumerate(metrics):
         ax = axes[idx // 3, idx % 3]
-        
-        col_yahoo = col_base + '_yahoo'
-        col_sa = col_base + '_sa'
-        
-        # Calculate mean of both sources
-        df_merged[f'{col_base}_mean'] = df_merged[[col_yahoo, col_sa]].mean(axis=1)
-        
-        # Sort by mean values
-        df_plot = df_merged.sort_values(f'{col_base}_mean', ascending=True).dropna(subset=[f'{col_base}_mean'])
-        
-        x = np.arange(len(df_plot))
-        
+
+        # Sort by mean values and drop rows where both sources are missing
+        col_means = means[:, idx]
+        order = np.argsort(col_means)[:np.count_nonzero(~np.isnan(col_means))]
+        vals = col_means[order]
+        tickers = all_tickers_arr[order]
+
         # Get colors for each company
-        bar_colors = [ticker_colors[ticker] for ticker in df_plot['Ticker']]
-        
+        bar_colors = [ticker_colors[ticker] for ticker in tickers]
+
         # Plot horizontal bars
-        y_pos = np.arange(len(df_plot))
-        ax.barh(y_pos, df_plot[f'{col_base}_mean'], color=bar_colors, alpha=0.8, edgecolor='black', linewidth=1.2)
-        
+        y_pos = np.arange(len(vals))
+        ax.barh(y_pos, vals, color=bar_colors, alpha=0.8, edgecolor='black', linewidth=1.2)
+
         ax.set_xlabel(f'{title_text} (Mean)', fontsize=10)
         ax.set_title(f'{title_text}', fontweight='bold', fontsize=11)
         ax.set_yticks(y_pos)
-        ax.set_yticklabels(df_plot['Ticker'], fontsize=10)
+        ax.set_yticklabels(tickers, fontsize=10)
         ax.grid(axis='x', alpha=0.4, linestyle='--', linewidth=0.5)
-        
+
         # Add value labels with dynamic offset based on metric
-        mean_range = df_plot[f'{col_base}_mean'].max() - df_plot[f'{col_base}_mean'].min()
+        mean_range = vals[-1] - vals[0] if len(vals) else 0.0
         # Set appropriate minimum offset for each metric
         if title_text == 'VCR':
             min_offset = 0.02
@@ -594,16 +630,12 @@ def create_consolidated_mean_visualizations(df_full, version='v1'):
         else:  # P/B Ratio
             min_offset = 0.8
         offset = max(mean_range * 0.04, min_offset)
-        for i, (_, row) in enumerate(df_plot.iterrows()):
-            if not pd.isna(row[f'{col_base}_mean']):
-                if title_text == 'VCR':
-                    label_text = f"{row[f'{col_base}_mean']:.3f}"
-                else:
-                    label_text = f"{row[f'{col_base}_mean']:.2f}"
-                ax.text(row[f'{col_base}_mean'] + offset, i, label_text, 
-                       va='center', ha='left', fontsize=9, fontweight='bold')
+        fmt = '{:.3f}' if title_text == 'VCR' else '{:.2f}'
+        for i, val in enumerate(vals):
+            ax.text(val + offset, i, fmt.format(val),
+                   va='center', ha='left', fontsize=9, fontweight='bold')
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Create pic directory with date-specific subdirectory
     timestamp = datetime.now().strftime('%Y_%m%d')
@@ -614,26 +646,28 @@ def create_consolidated_mean_visualizations(df_full, version='v1'):
     output_file = os.path.join(pic_dir, f'consolidated_mean_{version}.png')
     
     # Save the figure
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    print(f"\n✓ Saved consolidated mean visualization to: {output_file}")
+    # compress_level=1: near-instant PNG encoding, marginally larger files
+    fig.savefig(output_file, dpi=dpi, bbox_inches='tight',
+                pil_kwargs={'compress_level': 1})
+    log.info(f"\n✓ Saved consolidated mean visualization to: {output_file}")
     
     return fig
 
 
 def create_summary_stats(df):
     """Print summary statistics"""
-    print("\n" + "="*80)
-    print("MAGNIFICENT 7 - VALUATION MEASURES SUMMARY")
-    print("="*80)
+    log.info("\n" + SEP_EQ)
+    log.info("MAGNIFICENT 7 - VALUATION MEASURES SUMMARY")
+    log.info(SEP_EQ)
     
-    print("\n📊 MARKET CAPITALIZATION RANKINGS:")
-    print("-" * 80)
+    log.info("\n📊 MARKET CAPITALIZATION RANKINGS:")
+    log.info(SEP_DASH)
     mc_sorted = df.sort_values('Market Cap_numeric', ascending=False)
-    for idx, row in mc_sorted.iterrows():
-        print(f"  {row['Ticker']:6s} - {row['Market Cap']}")
+    for ticker, market_cap in zip(mc_sorted['Ticker'].to_numpy(), mc_sorted['Market Cap'].to_numpy()):
+        log.info(f"  {ticker:6s} - {market_cap}")
     
-    print("\n💰 VALUATION MULTIPLES - HIGHEST TO LOWEST:")
-    print("-" * 80)
+    log.info("\n💰 VALUATION MULTIPLES - HIGHEST TO LOWEST:")
+    log.info(SEP_DASH)
     
     metrics = [
         ('Trailing P/E', 'Trailing P/E_numeric'),
@@ -648,121 +682,103 @@ def create_summary_stats(df):
     
     for label, col in metrics:
         sorted_df = df.sort_values(col, ascending=False).dropna(subset=[col])
-        print(f"\n  {label}:")
-        for idx, row in sorted_df.iterrows():
-            val = row[col]
-            print(f"    {row['Ticker']:6s} - {val:8.2f}")
+        log.info(f"\n  {label}:")
+        for ticker, val in zip(sorted_df['Ticker'].to_numpy(), sorted_df[col].to_numpy()):
+            log.info(f"    {ticker:6s} - {val:8.2f}")
     
-    print("\n" + "="*80)
+    log.info("\n" + SEP_EQ)
+
+
+def _render_figure_task(task):
+    """Build and save one figure in a worker process.
+
+    Takes a small (kind, version, exclude_tickers) tuple; the worker
+    pulls its frame from the (fork-inherited) _load_raw cache rather
+    than receiving a pickled DataFrame.
+    """
+    kind, version, exclude = task
+    if kind == 'yahoo':
+        df = load_and_prepare_data(data_source='yahoo_finance')
+        if exclude:
+            df = df[~df['Ticker'].isin(exclude)]
+        create_visualizations(df, version=version)
+    elif kind == 'consolidated':
+        create_consolidated_visualizations(load_and_prepare_data(data_source='both'),
+                                           version=version, exclude_tickers=exclude)
+    else:
+        create_consolidated_mean_visualizations(load_and_prepare_data(data_source='both'),
+                                                version=version, exclude_tickers=exclude)
 
 
 def main():
     """Main execution function"""
-    print("="*80)
-    print("VALUATION MEASURES VISUALIZATION")
-    print("="*80)
-    
-    # Part 1: Yahoo Finance visualizations (v1 & v2)
-    print("\n[1/6] Creating Yahoo Finance visualizations...")
-    print("-"*80)
+    log.info(SEP_EQ)
+    log.info("VALUATION MEASURES VISUALIZATION")
+    log.info(SEP_EQ)
+
     df_yahoo = load_and_prepare_data(data_source='yahoo_finance')
-    
-    print(f"Loaded Yahoo Finance data for {len(df_yahoo)} companies: {', '.join(df_yahoo['Ticker'].tolist())}")
-    
-    print("\nCreating Yahoo Finance v1 (all 7 companies)...")
-    fig1 = create_visualizations(df_yahoo)
-    
-    create_summary_stats(df_yahoo)
-    
-    print("\n✓ Yahoo Finance v1 complete!")
-    
+    log.info(f"Loaded Yahoo Finance data for {len(df_yahoo)} companies: {', '.join(df_yahoo['Ticker'].tolist())}")
+
+    df_full = load_and_prepare_data(data_source='both')
+    log.info(f"Loaded data from both sources:")
+    log.info(f"  - Yahoo Finance: {len(df_full[df_full['Data_Source']=='yahoo_finance'])} companies")
+    log.info(f"  - StockAnalysis: {len(df_full[df_full['Data_Source']=='stockanalysis'])} companies")
+
     # Load config for filtering
     config = load_config()
-    
-    # Create filtered version if configured
-    if config['visualization']['create_filtered_version']:
-        exclude_tickers = config['exclude_from_visualizations']
-        label = config['visualization']['filtered_version_label']
-        
-        print(f"\nCreating Yahoo Finance v2 ({label} for better scale)...")
-        df_yahoo_filtered = df_yahoo[~df_yahoo['Ticker'].isin(exclude_tickers)].copy()
-        print(f"Filtered data: {', '.join(df_yahoo_filtered['Ticker'].tolist())}")
-        
-        fig2 = create_visualizations(df_yahoo_filtered)
-        
-        print(f"\n✓ Yahoo Finance v2 ({label}) complete!")
-    else:
-        print("\nSkipping filtered version (create_filtered_version=false in config)")
-    
-    # Part 2: Consolidated visualizations
-    print("\n" + "="*80)
-    print("[2/6] Creating Consolidated visualizations (Yahoo + StockAnalysis)...")
-    print("-"*80)
-    
-    df_full = load_and_prepare_data(data_source='both')
-    print(f"Loaded data from both sources:")
-    print(f"  - Yahoo Finance: {len(df_full[df_full['Data_Source']=='yahoo_finance'])} companies")
-    print(f"  - StockAnalysis: {len(df_full[df_full['Data_Source']=='stockanalysis'])} companies")
-    
-    print("\nCreating Consolidated v1 (all 7 companies)...")
-    fig3 = create_consolidated_visualizations(df_full, version='v1')
-    
-    print("\n✓ Consolidated v1 complete!")
-    
-    # Part 3: Consolidated v2 filtered
-    if config['visualization']['create_filtered_version']:
-        exclude_tickers = config['exclude_from_visualizations']
-        label = config['visualization']['filtered_version_label']
-        
-        print(f"\nCreating Consolidated v2 ({label} for better scale)...")
-        df_full_filtered = df_full[~df_full['Ticker'].isin(exclude_tickers)].copy()
-        print(f"Filtered data: {', '.join(sorted(df_full_filtered['Ticker'].unique()))}")
-        
-        fig4 = create_consolidated_visualizations(df_full_filtered, version='v2')
-    
-        print(f"\n✓ Consolidated v2 ({label}) complete!")
-    
-    # Part 3: Consolidated Mean visualizations
-    print("\n" + "="*80)
-    print("[3/6] Creating Consolidated Mean visualizations (Average of both sources)...")
-    print("-"*80)
-    
-    num_companies = len(df_full['Ticker'].unique())
-    print(f"\nCreating Consolidated Mean v1 (all {num_companies} companies)...")
-    fig5 = create_consolidated_mean_visualizations(df_full, version='v1')
-    
-    print("\n✓ Consolidated Mean v1 complete!")
-    
-    if config['visualization']['create_filtered_version']:
-        print(f"\nCreating Consolidated Mean v2 ({label} for better scale)...")
-        fig6 = create_consolidated_mean_visualizations(df_full_filtered, version='v2')
-        
-        print(f"\n✓ Consolidated Mean v2 ({label}) complete!")
-    
+    create_filtered = config['visualization']['create_filtered_version']
+    label = config['visualization']['filtered_version_label'] if create_filtered else ''
+    exclude_tickers = tuple(config['exclude_from_visualizations']) if create_filtered else ()
+
+    # Filtered versions are skipped for exactly one of two reasons:
+    # disabled in config, or the exclusion wouldn't drop any loaded
+    # ticker — rendering v2 figures identical to v1 on three workers
+    if not create_filtered:
+        log.info("\nSkipping filtered versions (create_filtered_version=false in config)")
+    elif not set(exclude_tickers) & set(df_yahoo['Ticker']):
+        log.info(f"\nSkipping filtered versions (excluded tickers"
+                 f" {', '.join(exclude_tickers)} not present in data)")
+        create_filtered = False
+        exclude_tickers = ()
+
+    # Figure rendering is CPU-bound and independent per figure, so the
+    # six builds go to a process pool; each worker re-derives its small
+    # input frame, which is cheaper than pickling DataFrames across
+    tasks = [('yahoo', 'v1', ()),
+             ('consolidated', 'v1', ()),
+             ('consolidated_mean', 'v1', ())]
+    if create_filtered:
+        tasks += [('yahoo', 'v2', exclude_tickers),
+                  ('consolidated', 'v2', exclude_tickers),
+                  ('consolidated_mean', 'v2', exclude_tickers)]
+
+    workers = min(len(tasks), os.cpu_count() or 1)
+    log.info(f"\nRendering {len(tasks)} figures on {workers} workers...")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(_render_figure_task, tasks))
+
+    create_summary_stats(df_yahoo)
+
     # Summary
-    print("\n" + "="*80)
-    print("SUMMARY")
-    print("="*80)
-    print("\n✓ All visualizations have been saved to the ./pic/ folder:")
-    
+    log.info("\n" + SEP_EQ)
+    log.info("SUMMARY")
+    log.info(SEP_EQ)
+    log.info("\n✓ All visualizations have been saved to the ./pic/ folder:")
+
     num_companies = len(df_yahoo)
-    label = config['visualization']['filtered_version_label'] if config['visualization']['create_filtered_version'] else ''
-    
-    print(f"  1. Yahoo Finance v1 (all {num_companies} companies)")
-    if config['visualization']['create_filtered_version']:
-        print(f"  2. Yahoo Finance v2 ({label})")
-        print(f"  3. Consolidated v1 (6 key metrics from both sources - all {num_companies} companies)")
-        print(f"  4. Consolidated v2 (6 key metrics from both sources - {label})")
-        print(f"  5. Consolidated Mean v1 (average of both sources - all {num_companies} companies)")
-        print(f"  6. Consolidated Mean v2 (average of both sources - {label})")
+
+    log.info(f"  1. Yahoo Finance v1 (all {num_companies} companies)")
+    if create_filtered:
+        log.info(f"  2. Yahoo Finance v2 ({label})")
+        log.info(f"  3. Consolidated v1 (6 key metrics from both sources - all {num_companies} companies)")
+        log.info(f"  4. Consolidated v2 (6 key metrics from both sources - {label})")
+        log.info(f"  5. Consolidated Mean v1 (average of both sources - all {num_companies} companies)")
+        log.info(f"  6. Consolidated Mean v2 (average of both sources - {label})")
     else:
-        print(f"  2. Consolidated v1 (6 key metrics from both sources - all {num_companies} companies)")
-        print(f"  3. Consolidated Mean v1 (average of both sources - all {num_companies} companies)")
-    print("\n📊 Consolidated metrics: Trailing P/E, Forward P/E, PEG Ratio, P/S Ratio, P/B Ratio, VCR")
-    print("\nVisualization complete! 🎉")
-    
-    # Show the plot
-    # plt.show()
+        log.info(f"  2. Consolidated v1 (6 key metrics from both sources - all {num_companies} companies)")
+        log.info(f"  3. Consolidated Mean v1 (average of both sources - all {num_companies} companies)")
+    log.info("\n📊 Consolidated metrics: Trailing P/E, Forward P/E, PEG Ratio, P/S Ratio, P/B Ratio, VCR")
+    log.info("\nVisualization complete! 🎉")
 
 
 if __name__ == "__main__":
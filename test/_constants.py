@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""Shared constants for the comparison scripts.
+
+Tuples rather than lists so every importer shares one immutable,
+hashable object — usable directly as a cache key.
+"""
+
+TICKERS = ('AAPL', 'MSFT', 'GOOG', 'AMZN', 'META', 'NVDA', 'TSLA')
+
+# Display label -> consolidated column name (same for both sources)
+METRIC_PAIRS = (
+    ('Trailing P/E', 'Trailing P/E'),
+    ('Forward P/E', 'Forward P/E'),
+    ('PEG Ratio', 'PEG Ratio'),
+    ('PS Ratio', 'P/S Ratio'),
+    ('PB Ratio', 'P/B Ratio'),
+)
@@ -1,47 +1,33 @@
 #!/usr/bin/env python3
+import os
+import sys
+
 import pandas as pd
 
-df = pd.read_csv('csv/valuation_measures_current.csv')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tool.valuations import load_valuations
+from _constants import TICKERS, METRIC_PAIRS
+
+df = load_valuations()
+
+SEP_EQ = '=' * 90
 
-print("="*90)
+# One pivot instead of two boolean-mask scans of the whole frame per
+# ticker: rows become Ticker, columns become (metric, source) pairs
+wide = (df.set_index(['Ticker', 'Data_Source'])[[col for _, col in METRIC_PAIRS]]
+        .unstack('Data_Source'))
+wide = wide.reindex(TICKERS)
+
+print(SEP_EQ)
 print("✅ DATA SUCCESSFULLY FETCHED FROM BOTH SOURCES!")
-print("="*90)
+print(SEP_EQ)
 print("\nComparison: Yahoo Finance vs StockAnalysis.com")
-print("="*90)
-
-for ticker in ['AAPL', 'MSFT', 'GOOG', 'AMZN', 'META', 'NVDA', 'TSLA']:
-    yahoo = df[(df['Ticker'] == ticker) & (df['Data_Source'] == 'yahoo_finance')]
-    sa = df[(df['Ticker'] == ticker) & (df['Data_Source'] == 'stockanalysis')]
-    
-    print(f"\n{ticker}:")
-    print(f"  {'Metric':<25} {'Yahoo Finance':<15} {'StockAnalysis':<15}")
-    print(f"  {'-'*25} {'-'*15} {'-'*15}")
-    
-    # Trailing P/E
-    y_pe = yahoo['Trailing P/E'].values[0] if len(yahoo) > 0 else 'N/A'
-    sa_pe = sa['StockAnalysis PE Ratio'].values[0] if len(sa) > 0 else 'N/A'
-    print(f"  {'Trailing P/E':<25} {y_pe:<15} {sa_pe:<15}")
-    
-    # Forward P/E
-    y_fpe = yahoo['Forward P/E'].values[0] if len(yahoo) > 0 else 'N/A'
-    sa_fpe = sa['StockAnalysis Forward PE'].values[0] if len(sa) > 0 else 'N/A'
-    print(f"  {'Forward P/E':<25} {y_fpe:<15} {sa_fpe:<15}")
-    
-    # PEG Ratio
-    y_peg = yahoo['PEG Ratio (5yr expected)'].values[0] if len(yahoo) > 0 else 'N/A'
-    sa_peg = sa['StockAnalysis PEG Ratio'].values[0] if len(sa) > 0 else 'N/A'
-    print(f"  {'PEG Ratio':<25} {y_peg:<15} {sa_peg:<15}")
-    
-    # PS Ratio
-    y_ps = yahoo['Price/Sales (ttm)'].values[0] if len(yahoo) > 0 else 'N/A'
-    sa_ps = sa['StockAnalysis PS Ratio'].values[0] if len(sa) > 0 else 'N/A'
-    print(f"  {'PS Ratio':<25} {y_ps:<15} {sa_ps:<15}")
-    
-    # PB Ratio
-    y_pb = yahoo['Price/Book (mrq)'].values[0] if len(yahoo) > 0 else 'N/A'
-    sa_pb = sa['StockAnalysis PB Ratio'].values[0] if len(sa) > 0 else 'N/A'
-    print(f"  {'PB Ratio':<25} {y_pb:<15} {sa_pb:<15}")
-
-print("\n" + "="*90)
+print(SEP_EQ)
+
+# One to_string() call renders the whole table instead of 7 tickers x
+# 5 metrics of individual format+print pairs
+print(wide.to_string(float_format=lambda x: f'{x:.2f}', na_rep='N/A'))
+
+print("\n" + SEP_EQ)
 print("Note: Small differences are normal due to timing and calculation methods")
-print("="*90)
+print(SEP_EQ)
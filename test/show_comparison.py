@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
-import pandas as pd
+import os
+import sys
 
-df = pd.read_csv('csv/valuation_measures_current.csv')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tool.valuations import load_valuations
 
-print("="*70)
+df = load_valuations()
+
+SEP_EQ = '=' * 70
+
+print(SEP_EQ)
 print("✅ NASDAQ DATA SUCCESSFULLY FETCHED!")
-print("="*70)
+print(SEP_EQ)
 print("\nData Comparison - Yahoo Finance vs NASDAQ:")
-print("="*70)
+print(SEP_EQ)
 
 for ticker in ['GOOG', 'AMZN', 'META', 'TSLA']:
     yahoo = df[(df['Ticker'] == ticker) & (df['Data_Source'] == 'yahoo_finance')]
@@ -20,6 +26,6 @@ for ticker in ['GOOG', 'AMZN', 'META', 'TSLA']:
     print(f"  NASDAQ 2025 P/E Est:    {nasdaq['NASDAQ P/E 2025 Estimate'].values[0]}")
     print(f"  NASDAQ 2024 P/E Actual: {nasdaq['NASDAQ P/E 2024 Actual'].values[0]}")
 
-print("\n" + "="*70)
+print("\n" + SEP_EQ)
 print("⚠️  NOTE: AAPL, MSFT, NVDA - Page loading issues (retry recommended)")
-print("="*70)
+print(SEP_EQ)
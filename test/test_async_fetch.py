@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Fetch StockAnalysis statistics pages for all configured tickers without a
+browser: one aiohttp session, all requests in flight at once, parsed with
+the production parser. Replaces the headless-Chrome exploration flow -
+no Chrome startup, no per-page sleeps.
+"""
+import asyncio
+import os
+import sys
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from s01_fetch_data import load_tickers_from_config, parse_stockanalysis_page
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+                  'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+
+
+async def fetch_ticker(session, ticker):
+    url = f"https://stockanalysis.com/stocks/{ticker.lower()}/statistics/"
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
+            if resp.status != 200:
+                return ticker, f"HTTP {resp.status}"
+            html = await resp.text()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        return ticker, f"{type(e).__name__}: {e}"
+
+    text = BeautifulSoup(html, 'html.parser').get_text(separator='\n')
+    return ticker, parse_stockanalysis_page(text)
+
+
+async def main():
+    tickers = load_tickers_from_config()
+    print(f"Fetching {len(tickers)} tickers concurrently (no browser)...")
+
+    connector = aiohttp.TCPConnector(limit=10)
+    async with aiohttp.ClientSession(connector=connector, headers=HEADERS) as session:
+        results = await asyncio.gather(*(fetch_ticker(session, t) for t in tickers))
+
+    for ticker, result in results:
+        print(f"\n{ticker}:")
+        if isinstance(result, dict):
+            for label, value in result.items():
+                print(f"  {label:<12} {value if value is not None else 'N/A'}")
+        else:
+            print(f"  failed: {result}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
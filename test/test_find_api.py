@@ -1,8 +1,16 @@
 #!/usr/bin/env python3
+import mmap
 import re
 
-content = open('nasdaq_goog_page.html', 'r', encoding='utf-8').read()
-apis = re.findall(r'["\']([/]api/[^"\']+)["\']', content)
+# Compiled once; bytes pattern so the scan runs over the mmap directly
+API_RE = re.compile(rb'["\']([/]api/[^"\']+)["\']')
+
+with open('nasdaq_goog_page.html', 'rb') as f:
+    # mmap lets the regex engine scan the page without reading a
+    # multi-MB str into memory first
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        apis = {m.group(1) for m in API_RE.finditer(buf)}
+
 print('Found API endpoints:')
-for api in sorted(set(apis))[:30]:
-    print(f'  {api}')
+for api in sorted(apis)[:30]:
+    print(f'  {api.decode()}')
@@ -1,44 +1,94 @@
 #!/usr/bin/env python3
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-import time
+import asyncio
+import atexit
+import threading
 
-ticker = 'NVDA'
-url = f"https://stockanalysis.com/stocks/{ticker.lower()}/statistics/"
 
-chrome_options = Options()
-chrome_options.add_argument('--headless')
-chrome_options.add_argument('--disable-gpu')
-chrome_options.add_argument('--no-sandbox')
+TICKERS = ['NVDA']
 
-driver = webdriver.Chrome(options=chrome_options)
-driver.get(url)
+# One driver per worker thread: Selenium blocks per page load, so
+# overlapping N tickers needs N browsers. Thread-local storage reuses
+# each browser across however many tickers land on its thread.
+_local = threading.local()
+_drivers = []
+_drivers_lock = threading.Lock()
 
-print(f"Loading {ticker} from StockAnalysis.com...")
-time.sleep(3)
 
-# Get body text
-body_text = driver.find_element(By.TAG_NAME, 'body').text
-lines = body_text.split('\n')
+def get_driver():
+    """Lazily start one headless Chrome per worker thread."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
 
-print(f"Found {len(lines)} lines of text\n")
+    if getattr(_local, 'driver', None) is None:
+        chrome_options = Options()
+        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--no-sandbox')
+        _local.driver = webdriver.Chrome(options=chrome_options)
+        with _drivers_lock:
+            _drivers.append(_local.driver)
+    return _local.driver
 
-# Show lines around "Valuation Ratios"
-for i, line in enumerate(lines):
-    if 'Valuation Ratios' in line:
-        print(f"Found 'Valuation Ratios' at line {i}")
-        print("\nLines around it:")
+
+@atexit.register
+def _quit_drivers():
+    for driver in _drivers:
+        driver.quit()
+
+
+def check_ticker(ticker):
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    driver = get_driver()
+    url = f"https://stockanalysis.com/stocks/{ticker.lower()}/statistics/"
+    driver.get(url)
+
+    out = [f"Loading {ticker} from StockAnalysis.com..."]
+    # Unblock as soon as the section renders instead of a fixed sleep
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located((By.XPATH, "//*[contains(text(),'Valuation Ratios')]")))
+
+    # Get body text
+    body_text = driver.find_element(By.TAG_NAME, 'body').text
+    lines = body_text.splitlines()
+
+    # One pass builds a stripped-line -> first-index lookup; the label
+    # searches below become O(1) instead of their own full scans
+    idx = {}
+    for i, line in enumerate(lines):
+        idx.setdefault(line.strip(), i)
+
+    out.append(f"Found {len(lines)} lines of text\n")
+
+    # Show lines around "Valuation Ratios"
+    i = idx.get('Valuation Ratios')
+    if i is not None:
+        out.append(f"Found 'Valuation Ratios' at line {i}")
+        out.append("\nLines around it:")
         for j in range(max(0, i-2), min(len(lines), i+25)):
-            print(f"  [{j}] {lines[j]}")
-        break
-
-# Look for PE Ratio specifically
-print("\n" + "="*60)
-print("Looking for PE Ratio...")
-for i, line in enumerate(lines):
-    if line.strip() == 'PE Ratio' and i + 1 < len(lines):
-        print(f"Found at line {i}: '{line}'")
-        print(f"Next line [{i+1}]: '{lines[i+1]}'")
-
-driver.quit()
+            out.append(f"  [{j}] {lines[j]}")
+
+    # Look for PE Ratio specifically
+    out.append("\n" + "="*60)
+    out.append("Looking for PE Ratio...")
+    i = idx.get('PE Ratio')
+    if i is not None and i + 1 < len(lines):
+        out.append(f"Found at line {i}: '{lines[i]}'")
+        out.append(f"Next line [{i+1}]: '{lines[i+1]}'")
+
+    return '\n'.join(out)
+
+
+async def main():
+    # Overlap the per-ticker page loads; reports print in ticker order
+    # once everything has finished so output never interleaves
+    reports = await asyncio.gather(
+        *[asyncio.to_thread(check_ticker, t) for t in TICKERS])
+    for report in reports:
+        print(report)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
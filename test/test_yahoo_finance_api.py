@@ -1,48 +1,70 @@
 #!/usr/bin/env python3
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-import time
-
-ticker = 'AAPL'
-url = f"https://www.nasdaq.com/market-activity/stocks/{ticker.lower()}/price-earnings-peg-ratios"
-
-chrome_options = Options()
-chrome_options.add_argument('--headless')
-chrome_options.add_argument('--disable-gpu')
-chrome_options.add_argument('--no-sandbox')
-chrome_options.add_argument('--disable-dev-shm-usage')
-chrome_options.add_argument('--log-level=3')
-
-driver = webdriver.Chrome(options=chrome_options)
-driver.get(url)
-
-print(f"Loading {ticker}...")
-time.sleep(5)
-
-divs = driver.find_elements(By.TAG_NAME, 'div')
-print(f"Found {len(divs)} divs")
-
-found = False
-for div in divs:
-    try:
-        text = div.text.strip()
-        if 'Price/Earnings Ratio' in text and '2024 Actual' in text and len(text) < 1000:
-            print(f"\nFound data section:\n{text}\n")
-            found = True
-            break
-    except:
-        pass
-
-if not found:
-    print("Could not find Price/Earnings Ratio section")
-    print("\nSearching for any PEG mentions...")
-    for div in divs[:100]:
-        try:
-            text = div.text.strip()
-            if 'PEG' in text and len(text) < 200:
-                print(f"  - {text[:100]}")
-        except:
-            pass
-
-driver.quit()
+import atexit
+
+
+TICKERS = ['AAPL']
+
+_driver = None
+
+
+def get_driver():
+    """Lazily start one headless Chrome shared by every ticker in the run."""
+    global _driver
+    if _driver is None:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+
+        chrome_options = Options()
+        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--log-level=3')
+        _driver = webdriver.Chrome(options=chrome_options)
+        atexit.register(_driver.quit)
+    return _driver
+
+
+def check_ticker(ticker):
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    driver = get_driver()
+    url = f"https://www.nasdaq.com/market-activity/stocks/{ticker.lower()}/price-earnings-peg-ratios"
+    driver.get(url)
+
+    print(f"Loading {ticker}...")
+    # Wait for the ratios section to exist rather than sleeping a fixed 5s
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located((By.XPATH, "//*[contains(text(),'Price/Earnings Ratio')]")))
+
+    # Search browser-side in one round-trip: pulling every div and
+    # reading .text pays a WebDriver call per element. Try the table's
+    # own class first so Chrome only renders text for that subtree; the
+    # every-div scan stays as a fallback for markup changes
+    text = driver.execute_script(
+        "const root = document.querySelector("
+        "'div.price-earnings-peg-ratios__table, div[class*=\"price-earnings\"]');"
+        "if (root) return root.innerText;"
+        "return Array.from(document.querySelectorAll('div'))"
+        ".filter(d => d.innerText.includes('Price/Earnings Ratio')"
+        " && d.innerText.includes('2024 Actual')"
+        " && d.innerText.length < 1000)"
+        ".map(d => d.innerText)[0] || null")
+
+    if text:
+        print(f"\nFound data section:\n{text}\n")
+    else:
+        print("Could not find Price/Earnings Ratio section")
+        print("\nSearching for any PEG mentions...")
+        mentions = driver.execute_script(
+            "return Array.from(document.querySelectorAll('div')).slice(0, 100)"
+            ".map(d => d.innerText.trim())"
+            ".filter(t => t.includes('PEG') && t.length < 200)")
+        for mention in mentions:
+            print(f"  - {mention[:100]}")
+
+
+for ticker in TICKERS:
+    check_ticker(ticker)
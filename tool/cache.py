@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Simple file-based cache for fetched valuation data.
+
+Payloads are stored as JSON under .cache/{source}/{YYYY-MM-DD}/{ticker}.json
+so that re-running the fetch script within a day skips the network entirely
+for tickers that were already fetched - even when the run that fetched them
+failed partway and never made it into the CSV.
+"""
+
+import json
+import os
+import time
+from typing import Optional
+
+
+class FileCache:
+    """Store small JSON payloads keyed by (source, date, ticker)."""
+
+    def __init__(self, cache_dir: str = '.cache', ttl_seconds: float = 24 * 3600):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+
+    def _path(self, source: str, date: str, ticker: str) -> str:
+        return os.path.join(self.cache_dir, source, date, f"{ticker}.json")
+
+    def get(self, source: str, date: str, ticker: str) -> Optional[dict]:
+        """Return the cached payload, or None on miss / expiry / bad file."""
+        path = self._path(source, date, ticker)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl_seconds:
+                return None
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, source: str, date: str, ticker: str, payload: dict) -> None:
+        """Write the payload atomically (write to a temp file, then rename)."""
+        path = self._path(source, date, ticker)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
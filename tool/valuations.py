@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Shared loader for the current valuation-measures table.
+
+Keeps a Parquet mirror next to csv/valuation_measures_current.csv and
+serves whichever is fresh: Parquet stores typed columns and deserializes
+far faster than re-parsing the CSV on every interactive script run.
+"""
+
+import os
+
+import pandas as pd
+
+CSV_PATH = 'csv/valuation_measures_current.csv'
+PARQUET_PATH = 'csv/valuation_measures_current.parquet'
+
+
+def load_valuations(csv_path=CSV_PATH, parquet_path=PARQUET_PATH):
+    """Return the current valuation table, refreshing the Parquet mirror if stale."""
+    try:
+        if os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+            return pd.read_parquet(parquet_path)
+    except OSError:
+        pass
+
+    try:
+        # pyarrow's multithreaded CSV parser beats pandas' single-threaded
+        # C engine, and the arrow table converts straight to parquet below
+        import pyarrow.csv as pacsv
+        df = pacsv.read_csv(csv_path).to_pandas()
+    except ImportError:
+        df = pd.read_csv(csv_path)
+    try:
+        df.to_parquet(parquet_path, engine='pyarrow', compression='zstd')
+    except (ImportError, OSError):
+        pass  # no pyarrow / read-only checkout: just serve the CSV read
+    return df